@@ -1,3 +1,11 @@
 from django.contrib import admin
 
-# Register your models here.
\ No newline at end of file
+from .models import RegistroResolucao
+
+
+@admin.register(RegistroResolucao)
+class RegistroResolucaoAdmin(admin.ModelAdmin):
+    list_display = ('metodo', 'entrada', 'tempo_calculo_ms', 'criado_em')
+    list_filter = ('metodo',)
+    search_fields = ('hash_entrada', 'entrada')
+    date_hierarchy = 'criado_em'
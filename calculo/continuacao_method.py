@@ -0,0 +1,132 @@
+# calculo/continuacao_method.py
+import math
+from .newton_method import newton_raphson
+
+SUCESSOS_PARA_CRESCER = 2       # Subpassos convergidos seguidos antes de dobrar o passo em p
+MAX_PIORAS_SEGUIDAS = 3         # Iterações seguidas com |f| ou |Δx| crescendo antes de declarar divergência
+
+def continuacao_natural(func, func_derivada, valores_p, x0, erro=1e-7, i_max=50, max_reducoes=8):
+    """
+    Resolve f(x; p) = 0 para uma sequência de valores de p por continuação natural:
+    a raiz encontrada para um p é a estimativa inicial de Newton-Raphson para o próximo.
+    Quando um passo diverge, o passo em p é reduzido pela metade, até no mínimo
+    1/2**max_reducoes do passo original. Depois de um subpasso convergido o passo reduzido
+    é mantido, e só volta a dobrar após SUCESSOS_PARA_CRESCER subpassos convergidos seguidos.
+    func e func_derivada recebem (x, p).
+    Retorna: (curva, total_iteracoes, reducoes_passo)
+    """
+    curva = []
+    total_iteracoes = 0
+    reducoes_passo = 0
+
+    x = x0
+    p_atual = None      # Valor de p em que x é raiz (None antes do primeiro ponto)
+
+    for p_alvo in valores_p:
+        passo = 0.0 if p_atual is None else p_alvo - p_atual
+        passo_minimo = abs(passo) / 2 ** max_reducoes
+        reducoes = 0
+        sucessos_seguidos = 0
+        subpassos = 0
+        iteracoes_ponto = 0
+
+        while True:
+            p_tentativa = p_alvo if p_atual is None else p_atual + passo
+            if abs(p_alvo - p_tentativa) <= 1e-12 * max(1.0, abs(p_alvo)):
+                p_tentativa = p_alvo        # Evita acumular erro de arredondamento no último subpasso
+
+            raiz, iteracoes, f_na_raiz = _passo_newton(func, func_derivada, x, p_tentativa, erro, i_max)
+            iteracoes_ponto += iteracoes
+
+            if raiz is not None:        # Convergiu: avança em p
+                x, p_atual = raiz, p_tentativa
+                subpassos += 1
+                if p_tentativa == p_alvo:
+                    break
+                sucessos_seguidos += 1
+                if sucessos_seguidos >= SUCESSOS_PARA_CRESCER:
+                    passo *= 2.0
+                    sucessos_seguidos = 0
+                restante = p_alvo - p_atual
+                if abs(passo) > abs(restante):
+                    passo = restante        # Não ultrapassa o alvo
+                continue
+
+            # Divergiu: reduz o passo pela metade e tenta de novo a partir do último ponto convergido
+            if p_atual is None or abs(passo) / 2.0 < passo_minimo:
+                break
+            reducoes += 1
+            sucessos_seguidos = 0
+            passo /= 2.0
+
+        total_iteracoes += iteracoes_ponto
+        reducoes_passo += reducoes
+
+        curva.append({
+            'p': p_alvo,
+            'raiz': raiz,
+            'f_na_raiz': f_na_raiz,
+            'iteracoes': iteracoes_ponto,
+            'subpassos': subpassos,
+            'reducoes': reducoes,
+            'convergiu': raiz is not None,
+        })
+
+    return curva, total_iteracoes, reducoes_passo
+
+
+class _Divergencia(Exception):
+    pass
+
+
+def _passo_newton(func, func_derivada, x, p, erro, i_max):
+    """
+    Um Newton-Raphson com p fixo. Qualquer falha (derivada nula, máximo de iterações,
+    valor não finito ou erro de domínio) é tratada como divergência.
+    A divergência é detectada cedo: se |f(x)| ou o tamanho do passo |Δx| crescer por
+    MAX_PIORAS_SEGUIDAS iterações seguidas, desiste sem esperar i_max.
+    Retorna: (raiz ou None, iteracoes, f(raiz) ou None)
+    """
+    ultimo_f = [None]
+    estado = {'iteracoes': 0, 'x': None, 'abs_f': None, 'abs_dx': None, 'pioras_f': 0, 'pioras_dx': 0}
+
+    def func_p(x_):
+        ultimo_f[0] = func(x_, p)       # Guarda f(x) para o acompanhamento, sem reavaliar
+        return ultimo_f[0]
+
+    def acompanhar(iteracao, x_atual, _erro_calculado):
+        estado['iteracoes'] = iteracao
+        abs_f = abs(ultimo_f[0])
+        if not (math.isfinite(x_atual) and math.isfinite(abs_f)):
+            raise _Divergencia
+
+        if estado['abs_f'] is not None:
+            estado['pioras_f'] = estado['pioras_f'] + 1 if abs_f >= estado['abs_f'] else 0
+        if estado['x'] is not None:
+            abs_dx = abs(x_atual - estado['x'])
+            if estado['abs_dx'] is not None:
+                estado['pioras_dx'] = estado['pioras_dx'] + 1 if abs_dx > estado['abs_dx'] else 0
+            estado['abs_dx'] = abs_dx
+        estado['x'], estado['abs_f'] = x_atual, abs_f
+
+        if abs_f != 0 and max(estado['pioras_f'], estado['pioras_dx']) >= MAX_PIORAS_SEGUIDAS:
+            raise _Divergencia
+
+    try:
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, _ = newton_raphson(
+            func_p,
+            lambda x_: func_derivada(x_, p),
+            x,
+            erro,
+            i_max,
+            callback=acompanhar
+        )
+    except _Divergencia:
+        return None, estado['iteracoes'], None
+    except (ValueError, OverflowError, ZeroDivisionError, TypeError):
+        return None, max(estado['iteracoes'], 1), None
+
+    if raiz is None or atingiu_max_iter or not math.isfinite(raiz):
+        return None, iteracoes, None
+
+    return raiz, iteracoes, f_na_raiz
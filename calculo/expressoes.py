@@ -0,0 +1,24 @@
+# calculo/expressoes.py
+import sympy
+
+# --- CUIDADOS COM SEGURANÇA NO INPUT DO USUÁRIO ---
+# Únicos nomes (além das variáveis) que o 'sympify' pode resolver nas expressões digitadas
+FUNCOES_PERMITIDAS = {
+    "sin": sympy.sin, "cos": sympy.cos, "tan": sympy.tan,
+    "exp": sympy.exp, "ln": sympy.log, "log": sympy.log,
+    "log10": lambda arg: sympy.log(arg, 10),
+    "sqrt": sympy.sqrt, "abs": sympy.Abs, "fabs": sympy.Abs,
+    "pi": sympy.pi, "e": sympy.E,
+    "asin": sympy.asin, "acos": sympy.acos, "atan": sympy.atan,
+    "sinh": sympy.sinh, "cosh": sympy.cosh, "tanh": sympy.tanh,
+}
+
+
+def escopo_sympy(variaveis):
+    """
+    Escopo local seguro para o 'sympify': as funções permitidas mais os símbolos informados.
+    """
+    local_scope = FUNCOES_PERMITIDAS.copy()
+    for sym in variaveis:
+        local_scope[str(sym)] = sym
+    return local_scope
@@ -1,7 +1,17 @@
 import numpy as np
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import nullcontext
 from numpy.linalg import cond, matrix_rank, svd, solve
 
-def gauss_somente_web(A, b, cond_limite=1e5):
+try:
+    from threadpoolctl import threadpool_limits
+except ImportError:     # Opcional: sem ele, o BLAS multithread disputa os núcleos com as threads do pool
+    threadpool_limits = None
+
+TAMANHO_BLOCO_PADRAO = 64       # Colunas por painel na fatoração LU em blocos
+
+def gauss_somente_web(A, b, cond_limite=1e5, precisao_mista=False, tamanho_bloco=TAMANHO_BLOCO_PADRAO, num_threads=1,
+                      callback=None):
     
     try:
         # Garante que são arrays numpy para cálculos
@@ -17,6 +27,37 @@ def gauss_somente_web(A, b, cond_limite=1e5):
 
     # CASO 1: MATRIZ QUADRADA
     if m == n:
+        if precisao_mista:
+            # Sem matrix_rank/cond: são duas SVDs em float64, mais caras que a própria resolução.
+            # O erro retroativo do refinamento já indica quando A é mal condicionada.
+            try:
+                x, iteracoes_refinamento, erro_retroativo, usou_fallback = _resolver_precisao_mista(
+                    A_np, b_np, tamanho_bloco=tamanho_bloco, num_threads=num_threads, callback=callback
+                )
+            except ValueError:
+                return {
+                    'status': 'singular',
+                    'solucao': None,
+                    'mensagem': 'Este sistema é SINGULAR (pivô nulo na eliminação). Não pode ser resolvido por Eliminação de Gauss. Tente o método SVD.'
+                }
+
+            mensagem_metodo = (
+                f"Solução obtida por Eliminação de Gauss em precisão mista (LU em float32, "
+                f"{iteracoes_refinamento} refinamento(s) em float64)."
+            )
+            if usou_fallback:
+                mensagem_metodo += (
+                    "\nO refinamento estagnou (A mal condicionada ou fora da faixa de float32); "
+                    "a solução foi recalculada em float64."
+                )
+            return {
+                'status': 'sucesso_gauss',
+                'solucao': list(x),
+                'iteracoes_refinamento': iteracoes_refinamento,
+                'erro_retroativo': erro_retroativo,
+                'mensagem': f"{mensagem_metodo}\nErro retroativo: {erro_retroativo:.2e}."
+            }
+
         if matrix_rank(A_np) < n:
             return {
                 'status': 'singular',
@@ -30,7 +71,7 @@ def gauss_somente_web(A, b, cond_limite=1e5):
             mensagem_cond = f"Sistema mal condicionado (cond(A) = {c:.2e}). O resultado pode conter erros numéricos."
 
         try:
-            x = _eliminacao_gauss_pura(A_np, b_np)
+            x = _eliminacao_gauss_pura(A_np, b_np, tamanho_bloco, num_threads, callback)
             return {
                 'status': 'sucesso_gauss',
                 'solucao': list(x), # Converte para lista para JSON/template
@@ -51,28 +92,170 @@ def gauss_somente_web(A, b, cond_limite=1e5):
             'mensagem': 'Este sistema NÃO é quadrado (m ≠ n). Não pode ser resolvido por Eliminação de Gauss. Tente Mínimos Quadrados.'
         }
 
-def _eliminacao_gauss_pura(A, b):
+def _eliminacao_gauss_pura(A, b, tamanho_bloco=TAMANHO_BLOCO_PADRAO, num_threads=1, callback=None):
     
-    n = len(b)
-    Ab = np.hstack([A, b]) 
+    LU, piv = fatoracao_lu(A, tamanho_bloco=tamanho_bloco, num_threads=num_threads, callback=callback)
+    x = resolver_lu(LU, piv, b)
 
-    for k in range(n - 1):
-        i_max = np.argmax(np.abs(Ab[k:n, k])) + k
-        Ab[[k, i_max]] = Ab[[i_max, k]]
-        
-        if np.isclose(Ab[k, k], 0):
+    return x.flatten()
+
+
+def _erro_retroativo(A, b, x):
+    """
+    Erro retroativo normwise: ||b - Ax|| / (||A|| ||x|| + ||b||), na norma infinito.
+    """
+    r = b.reshape(-1) - A @ x
+    denominador = np.linalg.norm(A, np.inf) * np.linalg.norm(x, np.inf) + np.linalg.norm(b, np.inf)
+    return np.linalg.norm(r, np.inf) / denominador if denominador != 0 else 0.0
+
+
+def _resolver_precisao_mista(A, b, max_refinamentos=10, tamanho_bloco=TAMANHO_BLOCO_PADRAO, num_threads=1,
+                             callback=None):
+    """
+    Fatora A uma única vez em float32 e refina a solução com resíduos calculados em float64.
+    Se o refinamento estagnar antes de atingir a precisão de float64, refaz tudo em float64.
+    Retorna: (x, iteracoes_refinamento, erro_retroativo, usou_fallback)
+    """
+    n = A.shape[0]
+    tolerancia = n * np.finfo(np.float64).eps
+
+    x, erro_atual, iteracoes = None, np.inf, 0
+    try:
+        with np.errstate(over='ignore', invalid='ignore', divide='ignore'):     # Overflow em float32 vira inf/NaN
+            LU32, piv = fatoracao_lu(A, dtype=np.float32, tamanho_bloco=tamanho_bloco, num_threads=num_threads,
+                                     callback=callback)
+            x = resolver_lu(LU32, piv, b)
+            erro_atual = _erro_retroativo(A, b, x)
+
+            while not (erro_atual <= tolerancia) and np.isfinite(erro_atual) and iteracoes < max_refinamentos:
+                r = b.reshape(-1) - A @ x       # Resíduo em float64 — O(n²)
+                x_novo = x + resolver_lu(LU32, piv, r)
+                erro_novo = _erro_retroativo(A, b, x_novo)
+                iteracoes += 1
+
+                if not erro_novo < 0.5 * erro_atual:      # Estagnou (ou divergiu): não vale continuar refinando
+                    if erro_novo < erro_atual:
+                        x, erro_atual = x_novo, erro_novo
+                    break
+                x, erro_atual = x_novo, erro_novo
+    except ValueError:
+        pass        # Pivô nulo em float32 (ex.: perda de precisão): tenta em float64 abaixo
+
+    if not (erro_atual <= tolerancia):      # Também cobre NaN
+        x = _eliminacao_gauss_pura(A, b, tamanho_bloco, num_threads, callback)
+        return x, iteracoes, _erro_retroativo(A, b, x), True
+
+    return x, iteracoes, erro_atual, False
+
+
+def fatoracao_lu(A, dtype=np.float64, tamanho_bloco=TAMANHO_BLOCO_PADRAO, num_threads=1, callback=None):
+    """
+    Fatoração LU com pivoteamento parcial (PA = LU), guardada numa única matriz.
+    Retorna: (LU, piv) — L abaixo da diagonal (diagonal unitária implícita), U no resto
+    e piv com a ordem das linhas. Pode ser reaproveitada para vários vetores b.
+
+    A fatoração é feita em blocos: cada painel de `tamanho_bloco` colunas é eliminado
+    coluna a coluna e a submatriz restante é atualizada de uma vez com um produto de
+    matrizes (GEMM), dividido em faixas de linhas entre `num_threads` threads. Com
+    num_threads > 1 o BLAS fica limitado a 1 thread durante a fatoração (threadpoolctl),
+    para não somar as threads do BLAS às do pool.
+    Se callback for informado, é chamado ao fim de cada painel com (colunas_eliminadas, None, None).
+    Um pivô é considerado nulo quando |pivô| <= n·eps·max|A| (relativo à escala de A).
+    """
+    LU = np.array(A, dtype=dtype)
+    n = LU.shape[0]
+    piv = np.arange(n)
+    nb = max(1, int(tamanho_bloco))
+    limite_pivo = n * np.finfo(LU.dtype).eps * np.max(np.abs(LU), initial=0.0)
+
+    executor = ThreadPoolExecutor(max_workers=num_threads) if num_threads > 1 else None
+    limite_blas = limitar_blas() if executor is not None else nullcontext()
+    try:
+        with limite_blas:
+            for k0 in range(0, n, nb):
+                k1 = min(k0 + nb, n)
+
+                _fatorar_painel(LU, piv, k0, k1, limite_pivo)
+
+                if k1 < n:
+                    # Linhas de U à direita do painel: resolve L11 · U12 = A12 (L11 triangular unitária)
+                    for i in range(k0 + 1, k1):
+                        LU[i, k1:] -= LU[i, k0:i] @ LU[k0:i, k1:]
+
+                    _atualizar_submatriz(LU, k0, k1, executor, num_threads)
+
+                if callback is not None:
+                    callback(k1, None, None)
+    finally:
+        if executor is not None:
+            executor.shutdown()
+
+    return LU, piv
+
+
+def limitar_blas():
+    """Limita o BLAS a 1 thread (se o threadpoolctl estiver instalado). Vale para o processo inteiro."""
+    if threadpool_limits is None:
+        return nullcontext()
+    return threadpool_limits(limits=1, user_api='blas')
+
+
+def _fatorar_painel(LU, piv, k0, k1, limite_pivo=0.0):
+    """
+    Eliminação com pivoteamento parcial restrita às colunas k0:k1 (o painel).
+    As trocas de linha são aplicadas na matriz inteira.
+    """
+    n = LU.shape[0]
+    for k in range(k0, k1):
+        i_max = np.argmax(np.abs(LU[k:n, k])) + k
+        if i_max != k:
+            LU[[k, i_max]] = LU[[i_max, k]]
+            piv[[k, i_max]] = piv[[i_max, k]]
+
+        if not abs(LU[k, k]) > limite_pivo:        # Também cobre NaN
             raise ValueError("Pivô nulo encontrado — sistema singular.")
 
-        for i in range(k + 1, n):
-            fator = Ab[i, k] / Ab[k, k]
-            Ab[i, k:] -= fator * Ab[k, k:] 
+        LU[k + 1:, k] /= LU[k, k]       # Multiplicadores (coluna de L)
+        LU[k + 1:, k + 1:k1] -= np.outer(LU[k + 1:, k], LU[k, k + 1:k1])       # Atualiza só o painel
+
+
+def _atualizar_submatriz(LU, k0, k1, executor, num_threads):
+    """
+    Atualização da submatriz restante: A22 -= L21 · U12.
+    Com executor, as linhas de A22 são divididas em faixas (o NumPy libera o GIL no GEMM).
+    """
+    n = LU.shape[0]
+    U12 = LU[k0:k1, k1:]
+
+    def atualizar_faixa(r0, r1):
+        LU[r0:r1, k1:] -= LU[r0:r1, k0:k1] @ U12
+
+    if executor is None or n - k1 < 2 * num_threads:
+        atualizar_faixa(k1, n)
+        return
+
+    limites = np.linspace(k1, n, num_threads + 1).astype(int)
+    tarefas = [executor.submit(atualizar_faixa, r0, r1) for r0, r1 in zip(limites[:-1], limites[1:]) if r1 > r0]
+    for tarefa in tarefas:
+        tarefa.result()
+
+
+def resolver_lu(LU, piv, b):
+    """
+    Resolve LUx = Pb por substituição progressiva e regressiva, em O(n²).
+    """
+    n = LU.shape[0]
+    y = np.array(b, dtype=float).reshape(-1)[piv]
+
+    for i in range(1, n):
+        y[i] -= np.dot(LU[i, :i], y[:i])
 
     x = np.zeros(n)
     for i in range(n - 1, -1, -1):
-        soma = np.dot(Ab[i, i + 1:n], x[i + 1:n])
-        x[i] = (Ab[i, -1] - soma) / Ab[i, i]
+        soma = np.dot(LU[i, i + 1:n], x[i + 1:n])
+        x[i] = (y[i] - soma) / LU[i, i]
 
-    return x.flatten()
+    return x
 
 
 def resolver_por_svd_web(A, b):
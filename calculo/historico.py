@@ -0,0 +1,160 @@
+# calculo/historico.py
+"""
+Gravação do histórico de resoluções fora do caminho da requisição (write-behind).
+As views só enfileiram o registro em memória; uma thread em segundo plano grava os
+registros pendentes com bulk_create, em lotes, quando o lote enche ou a cada intervalo.
+"""
+import atexit
+import hashlib
+import json
+import logging
+import math
+import threading
+from collections import deque
+
+from django.conf import settings
+from django.db import DatabaseError, OperationalError, connection
+
+logger = logging.getLogger(__name__)
+
+
+def hash_entrada(metodo, entrada, parametros):
+    """SHA-256 da entrada normalizada (chaves ordenadas, sem espaços supérfluos)."""
+    normalizado = json.dumps(
+        {'metodo': metodo, 'entrada': entrada, 'parametros': parametros},
+        sort_keys=True, separators=(',', ':'), default=str,
+    )
+    return hashlib.sha256(normalizado.encode('utf-8')).hexdigest()
+
+
+def _sanitizar_json(valor):
+    """
+    NaN e infinito não existem em JSON (o SQLite recusa o registro no CHECK JSON_VALID): viram None,
+    como em valor_json. Arrays e escalares do NumPy viram listas e números do Python.
+    """
+    if isinstance(valor, dict):
+        return {chave: _sanitizar_json(v) for chave, v in valor.items()}
+    if isinstance(valor, (list, tuple)):
+        return [_sanitizar_json(v) for v in valor]
+    if hasattr(valor, 'tolist'):
+        return _sanitizar_json(valor.tolist())
+    if isinstance(valor, float):
+        return valor if math.isfinite(valor) else None
+    return valor
+
+
+def _erro_transitorio(erro):
+    """Banco travado por outro processo: vale tentar de novo no próximo ciclo."""
+    return isinstance(erro, OperationalError) and 'locked' in str(erro).lower()
+
+
+class BufferHistorico:
+    """
+    Buffer em memória dos registros de resolução. Protegido por lock; a thread de
+    gravação é iniciada sob demanda no primeiro registro.
+    """
+
+    def __init__(self, tamanho_lote=100, intervalo=2.0, max_pendentes=10000):
+        self.tamanho_lote = tamanho_lote
+        self.intervalo = intervalo
+        self.max_pendentes = max_pendentes
+        self.descartados = 0
+        self._pendentes = deque(maxlen=max_pendentes)     # Cheio: o mais antigo sai ao entrar um novo
+        self._lock = threading.Lock()
+        self._lote_cheio = threading.Event()
+        self._thread = None
+
+    def registrar(self, metodo, entrada, parametros, resultado, tempo_calculo_ms, tempo_compilacao_ms=None):
+        from .models import RegistroResolucao
+
+        registro = RegistroResolucao(
+            metodo=metodo,
+            hash_entrada=hash_entrada(metodo, entrada, parametros),
+            entrada=entrada,
+            parametros=_sanitizar_json(parametros),
+            resultado=_sanitizar_json(resultado),
+            tempo_compilacao_ms=tempo_compilacao_ms,
+            tempo_calculo_ms=tempo_calculo_ms,
+        )
+
+        with self._lock:
+            if len(self._pendentes) >= self.max_pendentes:      # Banco travado: não deixa a memória crescer
+                self.descartados += 1
+            self._pendentes.append(registro)
+            cheio = len(self._pendentes) >= self.tamanho_lote
+            if self._thread is None:
+                self._thread = threading.Thread(target=self._laco_gravacao, name='historico-write-behind', daemon=True)
+                self._thread.start()
+
+        if cheio:
+            self._lote_cheio.set()
+
+    def descarregar(self):
+        """
+        Grava todos os registros pendentes. Retorna quantos foram gravados.
+        Se o banco estiver travado, o lote volta para a fila; outros erros fazem a gravação
+        seguir registro a registro, descartando só os que o banco recusar.
+        """
+        from .models import RegistroResolucao
+
+        with self._lock:
+            lote = list(self._pendentes)
+            self._pendentes.clear()
+        if not lote:
+            return 0
+
+        try:
+            RegistroResolucao.objects.bulk_create(lote, batch_size=self.tamanho_lote)
+            return len(lote)
+        except DatabaseError as e:
+            if _erro_transitorio(e):
+                logger.warning("Banco travado; %d registros do histórico voltam para a fila.", len(lote))
+                self._devolver(lote)
+                return 0
+            logger.exception("Falha ao gravar %d registros do histórico em lote; gravando um a um.", len(lote))
+            return self._gravar_um_a_um(lote)
+        finally:
+            connection.close()      # Esta thread não atende requisições: não segura a conexão aberta
+
+    def _devolver(self, lote):
+        """Recoloca o lote no início da fila, respeitando max_pendentes (os mais antigos saem primeiro)."""
+        with self._lock:
+            espaco = self.max_pendentes - len(self._pendentes)
+            devolvidos = lote[len(lote) - espaco:] if espaco > 0 else []
+            self.descartados += len(lote) - len(devolvidos)
+            self._pendentes.extendleft(reversed(devolvidos))
+
+    def _gravar_um_a_um(self, lote):
+        gravados = 0
+        for posicao, registro in enumerate(lote):
+            try:
+                registro.save(force_insert=True)
+                gravados += 1
+            except DatabaseError as e:
+                if _erro_transitorio(e):
+                    self._devolver(lote[posicao:])
+                    break
+                logger.warning("Registro do histórico descartado (%s): %s", registro.metodo, e)
+                with self._lock:
+                    self.descartados += 1
+        return gravados
+
+    def _laco_gravacao(self):
+        while True:
+            self._lote_cheio.wait(self.intervalo)
+            self._lote_cheio.clear()
+            self.descarregar()
+
+
+buffer_historico = BufferHistorico(
+    tamanho_lote=getattr(settings, 'HISTORICO_TAMANHO_LOTE', 100),
+    intervalo=getattr(settings, 'HISTORICO_INTERVALO_GRAVACAO', 2.0),
+)
+atexit.register(buffer_historico.descarregar)
+
+
+def registrar_resolucao(metodo, entrada, parametros, resultado, tempo_calculo_ms, tempo_compilacao_ms=None):
+    """Enfileira um registro no histórico, sem tocar no banco durante a requisição."""
+    if not getattr(settings, 'HISTORICO_ATIVO', True):
+        return
+    buffer_historico.registrar(metodo, entrada, parametros, resultado, tempo_calculo_ms, tempo_compilacao_ms)
@@ -0,0 +1,218 @@
+# calculo/lote.py
+"""
+Resolução em lote de problemas descritos em JSONL (um job por linha), usada pelo
+comando `manage.py solve_batch`. Cada processo do pool recebe um pedaço de linhas,
+agrupa os jobs pela expressão e compila cada expressão uma única vez (com cache
+no processo, reaproveitado entre pedaços).
+
+Formato dos jobs (campos opcionais entre colchetes):
+    {"metodo": "newton",   "funcao": "x**2 - 4", "x0": 1.0, [erro], [max_iter], [id]}
+    {"metodo": "bissecao", "funcao": "x**3 - x - 2", "a": 1, "b": 2, [erro], [max_iter], [id]}
+    {"metodo": "newton_sistemas", "funcoes": ["x1**2 + x2**2 - 4", "x1*x2 - 1"], "x0": [2, 0.5],
+     [erro], [max_iter], [reuso_jacobiano], [id]}
+    {"metodo": "gauss", "matriz": [[2, 1], [1, 3]], "vetor": [3, 5], [precisao_mista], [id]}
+"""
+import json
+
+import sympy
+from sympy.core.expr import Expr
+
+from .bissecao_method import metodo_bissecao
+from .expressoes import escopo_sympy
+from .gauss_method import gauss_somente_web
+from .newton_method import newton_raphson
+from .newton_sistemas_method import newton_sistemas
+from .progresso import valor_json
+
+MAX_FUNCOES_EM_CACHE = 256
+
+_cache_compilado = {}       # (metodo, expressão) -> funções compiladas, por processo
+
+
+def _sympify(funcao_str, variaveis):
+    func_sympy = sympy.sympify(funcao_str.strip().lower(), locals=escopo_sympy(variaveis))
+    if not isinstance(func_sympy, Expr):
+        raise ValueError(f"A função '{funcao_str}' não foi interpretada como uma expressão matemática escalar válida.")
+    extras = func_sympy.free_symbols - set(variaveis)
+    if extras:
+        nomes = ', '.join(sorted(str(sym) for sym in extras))
+        raise ValueError(f"A função '{funcao_str}' usa variáveis desconhecidas ({nomes}).")
+    return func_sympy
+
+
+def _compilar_escalar(funcao_str):
+    x_sym = sympy.symbols('x')
+    func_sympy = _sympify(funcao_str, [x_sym])
+    if func_sympy.is_number:
+        raise ValueError(f"A função fornecida é uma constante '{func_sympy}'. Não há raízes a procurar.")
+    return (
+        sympy.lambdify(x_sym, func_sympy, modules=['math']),
+        sympy.lambdify(x_sym, sympy.diff(func_sympy, x_sym), modules=['math']),
+    )
+
+
+def _compilar_sistema(funcoes):
+    x_syms = sympy.symbols(f'x1:{len(funcoes) + 1}')
+    F_sympy = sympy.Matrix([_sympify(f, x_syms) for f in funcoes])
+    return (
+        sympy.lambdify(x_syms, F_sympy, modules=['numpy']),
+        sympy.lambdify(x_syms, F_sympy.jacobian(x_syms), modules=['numpy']),
+    )
+
+
+def chave_expressao(job):
+    """Chave usada para agrupar os jobs que compartilham a mesma expressão compilada."""
+    metodo = job.get('metodo')
+    if not isinstance(metodo, str):
+        raise ValueError("O campo 'metodo' deve ser um texto (newton, bissecao, newton_sistemas ou gauss).")
+    if metodo in ('newton', 'bissecao'):
+        return ('escalar', str(job.get('funcao', '')).strip().lower())
+    if metodo == 'newton_sistemas':
+        funcoes = job.get('funcoes', [])
+        if not isinstance(funcoes, list) or not all(isinstance(f, str) for f in funcoes):
+            raise ValueError("O campo 'funcoes' deve ser uma lista de expressões em texto.")
+        return ('sistema', tuple(f.strip().lower() for f in funcoes))
+    return (metodo, None)
+
+
+def _compilado(chave):
+    if chave not in _cache_compilado:
+        try:
+            compilado = _compilar(chave)
+        except Exception as e:      # Expressão inválida: guarda o erro para não recompilar a cada job
+            compilado = e
+
+        if len(_cache_compilado) >= MAX_FUNCOES_EM_CACHE:
+            _cache_compilado.pop(next(iter(_cache_compilado)))      # Descarta a mais antiga
+        _cache_compilado[chave] = compilado
+
+    compilado = _cache_compilado[chave]
+    if isinstance(compilado, Exception):
+        raise compilado
+    return compilado
+
+
+def _compilar(chave):
+    tipo, expressao = chave
+    if tipo == 'escalar':
+        if not expressao:
+            raise ValueError("A expressão da função não pode estar vazia.")
+        return _compilar_escalar(expressao)
+    if not expressao:
+        raise ValueError("O sistema de equações não pode estar vazio.")
+    return _compilar_sistema(expressao)
+
+
+def resolver_job(job, chave):
+    """Resolve um job já decodificado. Retorna um dicionário serializável em JSON."""
+    metodo = job.get('metodo')
+    erro = float(job.get('erro', 1e-7))
+    max_iter = int(job.get('max_iter', 100))
+    if erro <= 0:
+        raise ValueError("A tolerância deve ser um valor positivo.")
+    if max_iter <= 0:
+        raise ValueError("O número máximo de iterações deve ser positivo.")
+
+    if metodo == 'newton':
+        func_callable, derivada_callable = _compilado(chave)
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado = newton_raphson(
+            func_callable, derivada_callable, float(job['x0']), erro, max_iter
+        )
+        convergiu = raiz is not None and not atingiu_max_iter
+        return {
+            'raiz': valor_json(raiz), 'iteracoes': iteracoes, 'f_na_raiz': valor_json(f_na_raiz),
+            'erro_calculado': valor_json(erro_calculado), 'convergiu': convergiu,
+        }
+
+    if metodo == 'bissecao':
+        func_callable, _ = _compilado(chave)
+        a, b = float(job['a']), float(job['b'])
+        if a >= b:
+            raise ValueError("O valor de 'a' deve ser menor que o valor de 'b'.")
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado = metodo_bissecao(
+            func_callable, a, b, erro, max_iter
+        )
+        convergiu = raiz is not None and not atingiu_max_iter
+        return {
+            'raiz': valor_json(raiz), 'iteracoes': iteracoes, 'f_na_raiz': valor_json(f_na_raiz),
+            'erro_calculado': valor_json(erro_calculado), 'convergiu': convergiu,
+        }
+
+    if metodo == 'newton_sistemas':
+        func_callable, jacobiana_callable = _compilado(chave)
+        x0 = [float(v) for v in job['x0']]
+        if len(x0) != len(chave[1]):
+            raise ValueError(f"O sistema tem {len(chave[1])} equações, mas a estimativa inicial tem {len(x0)} valores.")
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado, fatoracoes = newton_sistemas(
+            func_callable, jacobiana_callable, x0, erro, max_iter, int(job.get('reuso_jacobiano', 1))
+        )
+        convergiu = raiz is not None and not atingiu_max_iter
+        return {
+            'raiz': [valor_json(v) for v in raiz] if raiz is not None else None,
+            'iteracoes': iteracoes, 'fatoracoes': fatoracoes,
+            'f_na_raiz': [valor_json(v) for v in f_na_raiz] if f_na_raiz is not None else None,
+            'erro_calculado': valor_json(erro_calculado), 'convergiu': convergiu,
+        }
+
+    if metodo == 'gauss':
+        A, b = job['matriz'], job['vetor']
+        if not A or not b:
+            raise ValueError("Matriz A ou vetor b estão vazios.")
+        if len(A) != len(b):
+            raise ValueError(f"O número de linhas da matriz ({len(A)}) é diferente do número de termos no vetor b ({len(b)}).")
+        resultado_dict = gauss_somente_web(A, b, precisao_mista=bool(job.get('precisao_mista', False)))
+        solucao = resultado_dict.get('solucao')
+        return {
+            'solucao': [valor_json(v) for v in solucao] if solucao is not None else None,
+            'status_gauss': resultado_dict.get('status'),
+            'mensagem': resultado_dict.get('mensagem'),
+            'convergiu': solucao is not None,
+        }
+
+    raise ValueError(f"Método desconhecido: '{metodo}'. Use newton, bissecao, newton_sistemas ou gauss.")
+
+
+def resolver_pedaco(linhas):
+    """
+    Resolve um pedaço de linhas JSONL [(numero_linha, texto), ...].
+    Os jobs do pedaço são agrupados pela expressão antes de resolver.
+    Retorna: (linhas de resultado já serializadas e terminadas em '\\n', na mesma ordem
+    da entrada; quantas delas têm status 'erro')
+    """
+    jobs = []
+    grupos = {}
+    mensagens_invalido = {}
+    for posicao, (numero_linha, texto) in enumerate(linhas):
+        try:
+            job = json.loads(texto)
+            if not isinstance(job, dict):
+                raise ValueError("Cada linha deve ser um objeto JSON.")
+            chave = chave_expressao(job)
+        except Exception as e:      # Linha malformada: vira um registro de erro, sem derrubar o lote
+            job, chave = None, ('invalido', posicao)
+            mensagens_invalido[posicao] = str(e) if isinstance(e, ValueError) else f"{type(e).__name__}: {e}"
+        jobs.append(job)
+        grupos.setdefault(chave, []).append(posicao)
+
+    saida = [None] * len(linhas)
+    erros = 0
+    for chave, posicoes in grupos.items():
+        for posicao in posicoes:
+            numero_linha = linhas[posicao][0]
+            job = jobs[posicao]
+            registro = {'linha': numero_linha}
+            if job is None:
+                registro.update({'status': 'erro', 'mensagem': f"Job inválido: {mensagens_invalido[posicao]}"})
+            else:
+                registro['id'] = job.get('id')
+                registro['metodo'] = job.get('metodo')
+                try:
+                    registro.update(resolver_job(job, chave))
+                    registro['status'] = 'ok'
+                except Exception as e:
+                    registro.update({'status': 'erro', 'mensagem': f"{type(e).__name__}: {e}"})
+            if registro['status'] == 'erro':
+                erros += 1
+            saida[posicao] = json.dumps(registro, ensure_ascii=False) + '\n'
+
+    return saida, erros
@@ -0,0 +1,68 @@
+# calculo/management/commands/benchmark_gauss.py
+import os
+import time
+
+import numpy as np
+from django.core.management.base import BaseCommand
+
+from calculo.gauss_method import TAMANHO_BLOCO_PADRAO, fatoracao_lu, limitar_blas, resolver_lu, threadpool_limits
+
+
+class Command(BaseCommand):
+    help = (
+        "Mede a fatoração LU em blocos para vários tamanhos de sistema e números de threads. "
+        "O BLAS fica limitado a 1 thread em todas as medições (threadpoolctl), para que o speedup "
+        "meça só o paralelismo da própria fatoração."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--tamanhos', type=int, nargs='+', default=[1000, 2000, 3000, 4000, 5000],
+                            help="Valores de n (sistemas n x n).")
+        parser.add_argument('--threads', type=int, nargs='+', default=None,
+                            help="Números de threads a testar (padrão: 1 até o número de núcleos).")
+        parser.add_argument('--bloco', type=int, default=TAMANHO_BLOCO_PADRAO,
+                            help="Tamanho do bloco (colunas por painel).")
+        parser.add_argument('--repeticoes', type=int, default=1,
+                            help="Repetições por configuração (vale o menor tempo).")
+        parser.add_argument('--semente', type=int, default=0)
+
+    def handle(self, *args, **options):
+        threads = options['threads'] or list(range(1, (os.cpu_count() or 1) + 1))
+        rng = np.random.default_rng(options['semente'])
+
+        self.stdout.write(f"Fatoração LU em blocos (bloco = {options['bloco']}, {os.cpu_count() or 1} núcleo(s))")
+        if threadpool_limits is not None:
+            self.stdout.write("BLAS limitado a 1 thread (threadpoolctl).")
+        else:
+            self.stdout.write(self.style.WARNING(
+                "threadpoolctl não instalado: o BLAS usa as próprias threads e o speedup mistura os dois "
+                "paralelismos. Instale-o ou rode com OPENBLAS_NUM_THREADS=1 (ou MKL_NUM_THREADS=1)."
+            ))
+        self.stdout.write(f"{'n':>6} {'threads':>8} {'tempo (s)':>10} {'GFLOP/s':>9} {'speedup':>8} {'resíduo':>10}")
+
+        with limitar_blas():        # Inclusive com 1 thread: a linha de base também usa BLAS serial
+            for n in options['tamanhos']:
+                self._medir(n, threads, rng, options)
+
+    def _medir(self, n, threads, rng, options):
+        A = rng.standard_normal((n, n))
+        b = rng.standard_normal(n)
+        flops = 2 * n ** 3 / 3      # Custo dominante da fatoração LU
+        tempo_base = None
+
+        for t in threads:
+            melhor = None
+            for _ in range(options['repeticoes']):
+                inicio = time.perf_counter()
+                LU, piv = fatoracao_lu(A, tamanho_bloco=options['bloco'], num_threads=t)
+                decorrido = time.perf_counter() - inicio
+                melhor = decorrido if melhor is None else min(melhor, decorrido)
+
+            x = resolver_lu(LU, piv, b)
+            residuo = np.linalg.norm(b - A @ x, np.inf) / (np.linalg.norm(A, np.inf) * np.linalg.norm(x, np.inf))
+            tempo_base = tempo_base or melhor
+
+            self.stdout.write(
+                f"{n:>6} {t:>8} {melhor:>10.3f} {flops / melhor / 1e9:>9.2f} "
+                f"{tempo_base / melhor:>7.2f}x {residuo:>10.2e}"
+            )
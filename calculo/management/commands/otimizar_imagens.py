@@ -0,0 +1,79 @@
+# calculo/management/commands/otimizar_imagens.py
+import os
+
+from django.conf import settings
+from django.core.management.base import BaseCommand, CommandError
+
+
+class Command(BaseCommand):
+    help = (
+        "Redimensiona e recodifica as imagens PNG/JPEG de STATICFILES_DIRS (no próprio arquivo). "
+        "A largura máxima deve ser ~2x a maior largura em que a imagem aparece no CSS. "
+        "Requer Pillow (pip install Pillow); rode antes do collectstatic."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('--largura-maxima', type=int, default=500,
+                            help="Imagens mais largas são reduzidas a esta largura (mantém a proporção).")
+        parser.add_argument('--largura', action='append', default=[], metavar='ARQUIVO=LARGURA',
+                            help="Largura máxima específica de uma imagem (pode repetir), ex.: bixin-barbie.png=240.")
+        parser.add_argument('--paleta', action='store_true',
+                            help="Converte PNGs para paleta de 256 cores (PNG-8), bem menores para logos e desenhos.")
+        parser.add_argument('--simular', action='store_true',
+                            help="Só mostra o ganho estimado, sem alterar os arquivos.")
+
+    def handle(self, *args, **options):
+        try:
+            from PIL import Image
+        except ImportError:
+            raise CommandError("Este comando precisa do Pillow: pip install Pillow")
+
+        larguras = {}
+        for item in options['largura']:
+            nome, _, largura = item.partition('=')
+            if not largura.isdigit():
+                raise CommandError(f"Use ARQUIVO=LARGURA em --largura (recebido: '{item}').")
+            larguras[nome] = int(largura)
+        total_antes = total_depois = 0
+
+        for pasta in settings.STATICFILES_DIRS:
+            for raiz, _, arquivos in os.walk(pasta):
+                for nome in sorted(arquivos):
+                    extensao = os.path.splitext(nome)[1].lower()
+                    if extensao not in ('.png', '.jpg', '.jpeg'):
+                        continue
+                    caminho = os.path.join(raiz, nome)
+                    antes = os.path.getsize(caminho)
+
+                    with Image.open(caminho) as imagem:
+                        imagem.load()
+                    largura_maxima = larguras.get(nome, options['largura_maxima'])
+                    if imagem.width > largura_maxima:
+                        altura = round(imagem.height * largura_maxima / imagem.width)
+                        imagem = imagem.resize((largura_maxima, altura), Image.LANCZOS)
+
+                    caminho_temp = caminho + '.tmp'
+                    if extensao == '.png':
+                        if options['paleta'] and imagem.mode == 'RGBA':
+                            imagem = imagem.quantize(256, method=Image.Quantize.FASTOCTREE)     # Preserva a transparência
+                        elif options['paleta']:
+                            imagem = imagem.convert('RGB').quantize(256)
+                        imagem.save(caminho_temp, format='PNG', optimize=True)
+                    else:
+                        imagem.convert('RGB').save(caminho_temp, format='JPEG', quality=85, optimize=True, progressive=True)
+                    depois = os.path.getsize(caminho_temp)
+
+                    if depois < antes and not options['simular']:
+                        os.replace(caminho_temp, caminho)
+                    else:
+                        os.remove(caminho_temp)
+                    depois = min(depois, antes)
+
+                    total_antes += antes
+                    total_depois += depois
+                    self.stdout.write(f"{nome}: {antes / 1024:.1f} KiB -> {depois / 1024:.1f} KiB ({imagem.width}x{imagem.height})")
+
+        self.stdout.write(self.style.SUCCESS(
+            f"Total: {total_antes / 1024:.1f} KiB -> {total_depois / 1024:.1f} KiB"
+            + (" (simulação)" if options['simular'] else "")
+        ))
@@ -0,0 +1,125 @@
+# calculo/management/commands/solve_batch.py
+import os
+import time
+from collections import deque
+from multiprocessing import Pool
+
+from django.core.management.base import BaseCommand, CommandError
+
+from calculo.lote import resolver_pedaco
+
+
+def _pedacos(caminho, tamanho_pedaco, pular):
+    """
+    Lê o JSONL linha a linha (sem carregar o arquivo) e gera pedaços [(numero_linha, texto), ...].
+    Linhas em branco são ignoradas; as primeiras `pular` linhas com job também.
+    """
+    pedaco = []
+    jobs_vistos = 0
+    with open(caminho, encoding='utf-8') as entrada:
+        for numero_linha, texto in enumerate(entrada, start=1):
+            texto = texto.strip()
+            if not texto:
+                continue
+            jobs_vistos += 1
+            if jobs_vistos <= pular:
+                continue
+            pedaco.append((numero_linha, texto))
+            if len(pedaco) >= tamanho_pedaco:
+                yield pedaco
+                pedaco = []
+    if pedaco:
+        yield pedaco
+
+
+def _preparar_retomada(caminho):
+    """
+    Conta os resultados completos já gravados em `caminho` e descarta uma última linha
+    incompleta (interrupção no meio da escrita). Retorna quantos jobs já foram resolvidos.
+    """
+    if not os.path.exists(caminho):
+        return 0
+
+    completos = 0
+    fim_ultima_linha = 0
+    with open(caminho, 'rb') as saida:
+        for linha in saida:
+            if not linha.endswith(b'\n'):
+                break
+            completos += 1
+            fim_ultima_linha += len(linha)
+
+    if os.path.getsize(caminho) != fim_ultima_linha:
+        with open(caminho, 'r+b') as saida:
+            saida.truncate(fim_ultima_linha)
+    return completos
+
+
+class Command(BaseCommand):
+    help = (
+        "Resolve em lote os jobs de um arquivo JSONL (newton, bissecao, newton_sistemas, gauss) "
+        "num pool de processos, gravando um JSONL de resultados na mesma ordem da entrada. "
+        "O formato dos jobs está descrito em calculo/lote.py."
+    )
+
+    def add_arguments(self, parser):
+        parser.add_argument('entrada', help="Arquivo JSONL com um job por linha.")
+        parser.add_argument('saida', help="Arquivo JSONL de resultados.")
+        parser.add_argument('--processos', type=int, default=os.cpu_count() or 1,
+                            help="Número de processos do pool (padrão: número de núcleos).")
+        parser.add_argument('--tamanho-pedaco', type=int, default=200,
+                            help="Jobs enviados a cada processo por vez.")
+        parser.add_argument('--retomar', action='store_true',
+                            help="Continua um lote interrompido, pulando os jobs já gravados na saída.")
+        parser.add_argument('--intervalo-relatorio', type=float, default=5.0,
+                            help="Segundos entre relatórios de progresso.")
+
+    def handle(self, *args, **options):
+        entrada, saida = options['entrada'], options['saida']
+        processos = max(1, options['processos'])
+        tamanho_pedaco = max(1, options['tamanho_pedaco'])
+
+        if not os.path.exists(entrada):
+            raise CommandError(f"Arquivo de entrada não encontrado: {entrada}")
+
+        ja_resolvidos = _preparar_retomada(saida) if options['retomar'] else 0
+        if ja_resolvidos:
+            self.stdout.write(f"Retomando: {ja_resolvidos} jobs já resolvidos em {saida}.")
+
+        # Só alguns pedaços ficam em voo ao mesmo tempo: a memória não cresce com o tamanho da entrada
+        max_em_voo = processos * 2
+        em_voo = deque()
+        resolvidos = 0
+        erros = 0
+        inicio = time.perf_counter()
+        ultimo_relatorio = inicio
+
+        with Pool(processos) as pool, open(saida, 'a' if options['retomar'] else 'w', encoding='utf-8') as arquivo_saida:
+
+            def gravar_proximo():
+                nonlocal resolvidos, erros, ultimo_relatorio
+                linhas, erros_pedaco = em_voo.popleft().get()
+                arquivo_saida.writelines(linhas)
+                arquivo_saida.flush()
+                resolvidos += len(linhas)
+                erros += erros_pedaco
+
+                agora = time.perf_counter()
+                if agora - ultimo_relatorio >= options['intervalo_relatorio']:
+                    ultimo_relatorio = agora
+                    self.stdout.write(f"{resolvidos} jobs ({resolvidos / (agora - inicio):.1f} jobs/s)")
+
+            for pedaco in _pedacos(entrada, tamanho_pedaco, ja_resolvidos):
+                em_voo.append(pool.apply_async(resolver_pedaco, (pedaco,)))
+                if len(em_voo) >= max_em_voo:
+                    gravar_proximo()        # Espera o pedaço mais antigo: a saída segue a ordem da entrada
+
+            while em_voo:
+                gravar_proximo()
+
+        decorrido = time.perf_counter() - inicio
+        vazao = resolvidos / decorrido if decorrido > 0 else 0.0
+        self.stdout.write(self.style.SUCCESS(
+            f"{resolvidos} jobs resolvidos em {decorrido:.2f} s ({vazao:.1f} jobs/s, "
+            f"{erros} com erro, {processos} processos)."
+        ))
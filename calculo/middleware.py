@@ -0,0 +1,14 @@
+# calculo/middleware.py
+from django.middleware.gzip import GZipMiddleware as DjangoGZipMiddleware
+
+
+class GZipMiddleware(DjangoGZipMiddleware):
+    """
+    GZipMiddleware do Django, exceto para server-sent events: o gzip acumula os
+    eventos no buffer do compressor e o cliente deixaria de ver o progresso em tempo real.
+    """
+
+    def process_response(self, request, response):
+        if response.get('Content-Type', '').startswith('text/event-stream'):
+            return response
+        return super().process_response(request, response)
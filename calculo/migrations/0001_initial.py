@@ -0,0 +1,32 @@
+# Generated by Django 5.2.1 on 2026-10-19 13:18
+
+from django.db import migrations, models
+
+
+class Migration(migrations.Migration):
+
+    initial = True
+
+    dependencies = [
+    ]
+
+    operations = [
+        migrations.CreateModel(
+            name='RegistroResolucao',
+            fields=[
+                ('id', models.BigAutoField(auto_created=True, primary_key=True, serialize=False, verbose_name='ID')),
+                ('metodo', models.CharField(max_length=32)),
+                ('hash_entrada', models.CharField(max_length=64)),
+                ('entrada', models.TextField()),
+                ('parametros', models.JSONField(default=dict)),
+                ('resultado', models.JSONField(default=dict)),
+                ('tempo_compilacao_ms', models.FloatField(blank=True, null=True)),
+                ('tempo_calculo_ms', models.FloatField()),
+                ('criado_em', models.DateTimeField(auto_now_add=True)),
+            ],
+            options={
+                'ordering': ['-criado_em'],
+                'indexes': [models.Index(fields=['hash_entrada'], name='calculo_reg_hash_idx'), models.Index(fields=['criado_em'], name='calculo_reg_criado_idx')],
+            },
+        ),
+    ]
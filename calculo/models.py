@@ -1,3 +1,27 @@
 from django.db import models
 
-# Create your models here.
\ No newline at end of file
+
+class RegistroResolucao(models.Model):
+    """
+    Histórico de resoluções: um registro por cálculo concluído nas calculadoras.
+    hash_entrada identifica o problema normalizado (método + expressão + parâmetros),
+    permitindo encontrar rapidamente problemas repetidos.
+    """
+    metodo = models.CharField(max_length=32)
+    hash_entrada = models.CharField(max_length=64)
+    entrada = models.TextField()        # Expressão/sistema normalizado usado no hash
+    parametros = models.JSONField(default=dict)
+    resultado = models.JSONField(default=dict)
+    tempo_compilacao_ms = models.FloatField(null=True, blank=True)
+    tempo_calculo_ms = models.FloatField()
+    criado_em = models.DateTimeField(auto_now_add=True)
+
+    class Meta:
+        ordering = ['-criado_em']
+        indexes = [
+            models.Index(fields=['hash_entrada'], name='calculo_reg_hash_idx'),
+            models.Index(fields=['criado_em'], name='calculo_reg_criado_idx'),
+        ]
+
+    def __str__(self):
+        return f"{self.metodo} ({self.hash_entrada[:12]}) em {self.criado_em:%Y-%m-%d %H:%M:%S}"
@@ -0,0 +1,71 @@
+# calculo/newton_sistemas_method.py
+import numpy as np
+from .gauss_method import fatoracao_lu, resolver_lu
+
+def newton_sistemas(func, func_jacobiana, x, erro=1e-7, i_max=100, reuso_jacobiano=1):
+    """
+    Encontra uma raiz de um sistema não linear F(x) = 0 pelo método de Newton multivariado.
+    Cada passo resolve J(x) Δx = -F(x) com a fatoração LU de gauss_method.
+
+    reuso_jacobiano = 1 é o Newton clássico (refatora J a cada iteração); valores maiores
+    ativam o modo corda/Shamanskii, que reaproveita a mesma fatoração por várias iterações.
+    Se F(x) ou o passo deixar de ser finito (ex.: sqrt de negativo), para com falha (raiz None).
+    Retorna: (raiz, iteracoes, F(raiz), atingiu_max_iter, erro_calculado, fatoracoes)
+    """
+    x = np.array(x, dtype=float).reshape(-1)
+    f_x = np.array(func(*x), dtype=float).reshape(-1)
+    norma_f = np.linalg.norm(f_x, np.inf)
+    if not np.isfinite(norma_f):
+        return None, 0, None, False, None, 0       # F não é finita na estimativa inicial
+
+    LU, piv = None, None
+    idade_fatoracao = 0     # Iterações feitas com a fatoração atual
+    fatoracoes = 0
+    iter_count = 0
+    erro_calculado = None
+
+    while True:
+        # Critério de parada: F(x) = 0 (antes de contar o passo: F(x0) = 0 dá 0 iterações)
+        if norma_f == 0:
+            return x, iter_count, f_x, False, 0.0, fatoracoes
+
+        iter_count += 1 # Incrementa o contador de iterações a cada passo
+
+        # Refatora J quando não há fatoração ou quando ela já foi reaproveitada o suficiente
+        if LU is None or idade_fatoracao >= reuso_jacobiano:
+            try:
+                LU, piv = fatoracao_lu(np.array(func_jacobiana(*x), dtype=float))
+            except ValueError:
+                return None, iter_count, None, False, None, fatoracoes     # Jacobiana singular
+            fatoracoes += 1
+            idade_fatoracao = 0
+
+        delta = resolver_lu(LU, piv, -f_x)
+        x_new = x + delta
+        idade_fatoracao += 1
+
+        f_new = np.array(func(*x_new), dtype=float).reshape(-1)
+        norma_f_new = np.linalg.norm(f_new, np.inf)
+
+        # Passo ou F(x) não finitos: continuar só propagaria NaN até i_max
+        if not (np.all(np.isfinite(delta)) and np.isfinite(norma_f_new)):
+            return None, iter_count, None, False, None, fatoracoes
+
+        # Calcula o erro relativo (norma infinito)
+        norma_x_new = np.linalg.norm(x_new, np.inf)
+        norma_delta = np.linalg.norm(delta, np.inf)
+        erro_calculado = norma_delta / norma_x_new if norma_x_new != 0 else norma_delta
+
+        # Jacobiana "velha" que deixou de reduzir ||F||: força refatoração no próximo passo
+        if norma_f_new >= norma_f and idade_fatoracao > 1:
+            idade_fatoracao = reuso_jacobiano
+
+        x, f_x, norma_f = x_new, f_new, norma_f_new
+
+        # Critério de parada: erro relativo
+        if erro_calculado < erro:
+            return x, iter_count, f_x, False, erro_calculado, fatoracoes
+
+        # Critério de parada: iterações esgotadas
+        if iter_count >= i_max:
+            return x, iter_count, f_x, True, erro_calculado, fatoracoes
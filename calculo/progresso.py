@@ -0,0 +1,145 @@
+# calculo/progresso.py
+import json
+import math
+import queue
+import threading
+import time
+from array import array
+
+
+class TracoIteracoes:
+    """
+    Histórico de iterações guardado em arrays compactos (8 bytes por valor), com capacidade
+    fixa: ao encher, descarta um ponto a cada dois e passa a guardar só uma iteração a cada
+    `passo` (que dobra). A memória fica constante qualquer que seja o número de iterações;
+    a última iteração é sempre guardada à parte. Valores ausentes (None) viram NaN.
+    """
+
+    def __init__(self, capacidade=1000):
+        self.capacidade = max(2, int(capacidade))
+        self.passo = 1      # Guarda uma iteração a cada `passo` registradas
+        self.total = 0      # Iterações registradas (guardadas ou não)
+        self.iteracoes = array('q')
+        self.estimativas = array('d')
+        self.erros = array('d')
+        self._ultimo = None
+
+    def __len__(self):
+        return self.total
+
+    def registrar(self, iteracao, estimativa=None, erro=None):
+        ponto = (
+            int(iteracao),
+            math.nan if estimativa is None else float(estimativa),
+            math.nan if erro is None else float(erro),
+        )
+        self._ultimo = ponto
+        self.total += 1
+        if (self.total - 1) % self.passo:
+            return
+
+        if len(self.iteracoes) >= self.capacidade:      # Cheio: fica com metade dos pontos
+            self.iteracoes = self.iteracoes[::2]
+            self.estimativas = self.estimativas[::2]
+            self.erros = self.erros[::2]
+            self.passo *= 2
+            if (self.total - 1) % self.passo:
+                return
+        self.iteracoes.append(ponto[0])
+        self.estimativas.append(ponto[1])
+        self.erros.append(ponto[2])
+
+    def ultimo_ponto(self):
+        iteracao, estimativa, erro = self._ultimo
+        return {'iteracao': iteracao, 'estimativa': valor_json(estimativa), 'erro_calculado': valor_json(erro)}
+
+    def amostra(self, max_pontos=500):
+        """
+        Devolve o histórico em listas, com no máximo max_pontos (sempre inclui o último ponto).
+        """
+        n = len(self.iteracoes)
+        if self._ultimo is None:
+            return {'iteracao': [], 'estimativa': [], 'erro_calculado': []}
+        passo = max(1, math.ceil(n / max_pontos))
+        pontos = [(self.iteracoes[i], self.estimativas[i], self.erros[i]) for i in range(0, n, passo)]
+        if pontos and pontos[-1][0] == self._ultimo[0]:
+            pontos.pop()
+        if len(pontos) >= max_pontos:
+            pontos.pop()
+        pontos.append(self._ultimo)
+        return {
+            'iteracao': [p[0] for p in pontos],
+            'estimativa': [valor_json(p[1]) for p in pontos],
+            'erro_calculado': [valor_json(p[2]) for p in pontos],
+        }
+
+
+def valor_json(valor):
+    """NaN e infinito não existem em JSON: viram null."""
+    if valor is None:
+        return None
+    valor = float(valor)
+    return valor if math.isfinite(valor) else None
+
+
+class ExecucaoInterrompida(Exception):
+    """Levantada pelo callback de eventos_sse quando o cliente desconecta, para parar o solver."""
+
+
+def _evento_sse(evento, dados):
+    return f"event: {evento}\ndata: {json.dumps(dados)}\n\n"
+
+
+def eventos_sse(executar, intervalo=0.25, intervalo_ping=15.0, max_pontos_traco=500):
+    """
+    Roda executar(callback) numa thread e gera eventos server-sent events com o progresso.
+    O callback(iteracao, estimativa, erro) registra cada iteração no TracoIteracoes, mas só
+    publica um evento 'progresso' a cada `intervalo` segundos. No fim publica 'resultado'
+    (o dicionário devolvido por executar, com o histórico amostrado) ou 'erro'.
+    Comentários de ping a cada `intervalo_ping` segundos mantêm a conexão viva em proxies.
+    Se o gerador for fechado (cliente desconectou), o próximo callback levanta
+    ExecucaoInterrompida e a thread do solver termina.
+    """
+    fila = queue.Queue()
+    traco = TracoIteracoes(capacidade=2 * max_pontos_traco)
+    ultimo_envio = [0.0]
+    parar = threading.Event()
+
+    def callback(iteracao, estimativa=None, erro=None):
+        if parar.is_set():
+            raise ExecucaoInterrompida("Cliente desconectado.")
+        traco.registrar(iteracao, estimativa, erro)
+        agora = time.monotonic()
+        if agora - ultimo_envio[0] >= intervalo:
+            ultimo_envio[0] = agora
+            fila.put(('progresso', traco.ultimo_ponto()))
+
+    def alvo():
+        try:
+            resultado = executar(callback)
+            resultado['traco'] = traco.amostra(max_pontos_traco)
+            resultado['iteracoes_registradas'] = len(traco)
+            fila.put(('resultado', resultado))
+        except ExecucaoInterrompida:
+            pass        # Ninguém mais lê a fila
+        except Exception as e:
+            fila.put(('erro', {'mensagem': str(e)}))
+        finally:
+            fila.put(None)
+
+    threading.Thread(target=alvo, daemon=True).start()
+
+    try:
+        yield ": inicio\n\n"
+        while True:
+            try:
+                item = fila.get(timeout=intervalo_ping)
+            except queue.Empty:
+                yield ": ping\n\n"
+                continue
+            if item is None:
+                break
+            yield _evento_sse(*item)
+    except GeneratorExit:       # Resposta fechada antes do fim: avisa o solver para parar
+        parar.set()
+        raise
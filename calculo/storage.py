@@ -0,0 +1,18 @@
+# calculo/storage.py
+from whitenoise.storage import CompressedManifestStaticFilesStorage
+
+
+class ManifestStaticFilesNaoEstrito(CompressedManifestStaticFilesStorage):
+    """
+    Storage do WhiteNoise (nomes com hash + .gz/.br), mas sem exigir o manifesto.
+    Arquivo fora do manifesto tem o hash calculado na hora; se nem estiver em STATIC_ROOT
+    (checkout novo sem collectstatic, testes com DEBUG=False), a URL usa o nome original
+    em vez de a página inteira falhar com "Missing staticfiles manifest entry".
+    """
+    manifest_strict = False
+
+    def stored_name(self, name):
+        try:
+            return super().stored_name(name)
+        except ValueError:      # Arquivo não encontrado em STATIC_ROOT
+            return name
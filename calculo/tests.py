@@ -1,3 +1,372 @@
+import gzip
+import json
+import math
+import threading
+from unittest import mock, skipIf
+
+import numpy as np
+from django.db import IntegrityError, OperationalError
 from django.test import TestCase
 
-# Create your tests here.
\ No newline at end of file
+from .continuacao_method import continuacao_natural
+from .gauss_method import fatoracao_lu, gauss_somente_web, resolver_lu, threadpool_limits
+from .historico import BufferHistorico
+from .lote import resolver_pedaco
+from .models import RegistroResolucao
+from .newton_method import newton_raphson
+from .newton_sistemas_method import newton_sistemas
+from .progresso import ExecucaoInterrompida, TracoIteracoes, eventos_sse
+from .views import MAX_ITERACOES_STREAM
+
+
+def _sistema_circulo_hiperbole():
+    # x1² + x2² = 4 e x1·x2 = 1
+    func = lambda x1, x2: [x1**2 + x2**2 - 4, x1 * x2 - 1]
+    jacobiana = lambda x1, x2: [[2 * x1, 2 * x2], [x2, x1]]
+    return func, jacobiana
+
+
+class NewtonSistemasTests(TestCase):
+
+    def test_classico_fatora_a_cada_iteracao(self):
+        func, jacobiana = _sistema_circulo_hiperbole()
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, _, fatoracoes = newton_sistemas(
+            func, jacobiana, [2, 0.5], erro=1e-12
+        )
+        self.assertFalse(atingiu_max_iter)
+        self.assertLess(np.linalg.norm(f_na_raiz, np.inf), 1e-10)
+        self.assertEqual(fatoracoes, iteracoes)
+        self.assertAlmostEqual(raiz[0] * raiz[1], 1.0)
+
+    def test_corda_reaproveita_a_fatoracao(self):
+        func, jacobiana = _sistema_circulo_hiperbole()
+        raiz_classico = newton_sistemas(func, jacobiana, [2, 0.5], erro=1e-12)[0]
+        raiz, iteracoes, _, atingiu_max_iter, _, fatoracoes = newton_sistemas(
+            func, jacobiana, [2, 0.5], erro=1e-12, reuso_jacobiano=4
+        )
+        self.assertFalse(atingiu_max_iter)
+        self.assertLess(fatoracoes, iteracoes)
+        np.testing.assert_allclose(raiz, raiz_classico, rtol=1e-10)
+
+    def test_estimativa_inicial_ja_e_raiz(self):
+        func, jacobiana = _sistema_circulo_hiperbole()
+        x0 = [math.sqrt(2 + math.sqrt(3)), math.sqrt(2 - math.sqrt(3))]
+        func_exata = lambda x1, x2: [0.0, 0.0] if [x1, x2] == x0 else func(x1, x2)
+
+        raiz, iteracoes, _, atingiu_max_iter, erro_calculado, fatoracoes = newton_sistemas(func_exata, jacobiana, x0)
+        self.assertEqual((iteracoes, fatoracoes, erro_calculado, atingiu_max_iter), (0, 0, 0.0, False))
+        np.testing.assert_array_equal(raiz, x0)
+
+    def test_jacobiana_com_entradas_pequenas_nao_e_singular(self):
+        # Pivô relativo à escala de J: 1e-9 não é "zero" quando toda a Jacobiana é dessa ordem
+        func = lambda x1, x2: [1e-9 * (x1 - 1), 1e-9 * (x2 - 2)]
+        jacobiana = lambda x1, x2: [[1e-9, 0.0], [0.0, 1e-9]]
+
+        raiz, _, _, atingiu_max_iter, _, _ = newton_sistemas(func, jacobiana, [0.0, 0.0], erro=1e-12)
+        self.assertFalse(atingiu_max_iter)
+        np.testing.assert_allclose(raiz, [1.0, 2.0])
+
+    def test_para_quando_f_deixa_de_ser_finita(self):
+        func = lambda x1, x2: [np.sqrt(x1) - 1, x2]
+        jacobiana = lambda x1, x2: [[0.5 / np.sqrt(x1), 0.0], [0.0, 1.0]]
+
+        with np.errstate(invalid='ignore', divide='ignore'):
+            resultado = newton_sistemas(func, jacobiana, [-1.0, 0.0], i_max=100)
+        self.assertEqual(resultado[:4], (None, 0, None, False))
+
+
+class FatoracaoLUTests(TestCase):
+
+    def test_resolve_igual_ao_numpy_em_varios_blocos_e_threads(self):
+        rng = np.random.default_rng(0)
+        n = 150
+        A = rng.standard_normal((n, n)) + n * np.eye(n) * 0.1
+        b = rng.standard_normal(n)
+        esperado = np.linalg.solve(A, b)
+
+        for tamanho_bloco in (1, 7, 64, 200):
+            for num_threads in (1, 4):
+                with self.subTest(tamanho_bloco=tamanho_bloco, num_threads=num_threads):
+                    LU, piv = fatoracao_lu(A, tamanho_bloco=tamanho_bloco, num_threads=num_threads)
+                    np.testing.assert_allclose(resolver_lu(LU, piv, b), esperado, rtol=1e-9, atol=1e-12)
+
+    @skipIf(threadpool_limits is None, "threadpoolctl não instalado")
+    def test_blas_serial_durante_a_fatoracao_com_threads(self):
+        from threadpoolctl import threadpool_info
+
+        threads_blas = []
+        registrar = lambda *_: threads_blas.extend(
+            info['num_threads'] for info in threadpool_info() if info['user_api'] == 'blas'
+        )
+        with threadpool_limits(limits=2, user_api='blas'):      # BLAS com várias threads fora da fatoração
+            fatoracao_lu(np.eye(8) * 2.0, tamanho_bloco=2, num_threads=2, callback=registrar)
+        self.assertTrue(threads_blas)
+        self.assertEqual(set(threads_blas), {1})
+
+    def test_gauss_web_com_threads(self):
+        A = [[2, 1, -1], [-3, -1, 2], [-2, 1, 2]]
+        b = [8, -11, -3]
+        resultado = gauss_somente_web(A, b, tamanho_bloco=2, num_threads=2)
+        self.assertEqual(resultado['status'], 'sucesso_gauss')
+        np.testing.assert_allclose(resultado['solucao'], [2, 3, -1])
+
+    def test_matriz_singular(self):
+        with self.assertRaises(ValueError):
+            fatoracao_lu(np.array([[1.0, 2.0], [2.0, 4.0]]))
+        self.assertEqual(gauss_somente_web([[1, 2], [2, 4]], [1, 2])['status'], 'singular')
+
+
+class PrecisaoMistaTests(TestCase):
+
+    def test_bem_condicionada_refina_ate_float64(self):
+        rng = np.random.default_rng(1)
+        n = 80
+        A = rng.standard_normal((n, n)) + n * np.eye(n)
+        b = rng.standard_normal(n)
+
+        resultado = gauss_somente_web(A.tolist(), b.tolist(), precisao_mista=True)
+        self.assertEqual(resultado['status'], 'sucesso_gauss')
+        self.assertLessEqual(resultado['erro_retroativo'], n * np.finfo(np.float64).eps)
+        np.testing.assert_allclose(resultado['solucao'], np.linalg.solve(A, b), rtol=1e-10)
+
+    def test_fora_da_faixa_de_float32_recalcula_em_float64(self):
+        # 1e39 estoura float32 (inf/NaN na fatoração): deve cair para float64
+        resultado = gauss_somente_web([[1e39, 2e39], [3e39, 1e39]], [1e39, 2e39], precisao_mista=True)
+        self.assertEqual(resultado['status'], 'sucesso_gauss')
+        np.testing.assert_allclose(resultado['solucao'], [0.6, 0.2], rtol=1e-12)
+        self.assertIn('float64', resultado['mensagem'])
+
+
+class ContinuacaoTests(TestCase):
+
+    def test_segue_a_raiz_ao_longo_de_p(self):
+        func = lambda x, p: x**3 - p * x - 2
+        derivada = lambda x, p: 3 * x**2 - p
+        valores_p = [i / 10 for i in range(101)]
+
+        curva, _, reducoes_passo = continuacao_natural(func, derivada, valores_p, 1.0, erro=1e-10)
+        self.assertEqual(len(curva), len(valores_p))
+        self.assertTrue(all(ponto['convergiu'] for ponto in curva))
+        self.assertEqual(reducoes_passo, 0)
+        for ponto in curva:
+            self.assertLess(abs(func(ponto['raiz'], ponto['p'])), 1e-8)
+
+    def test_reduz_o_passo_e_alcanca_o_alvo(self):
+        # Newton em atan(x - p) diverge se |x0 - p| > ~1.39: o salto 0 -> 10 precisa de subpassos
+        func = lambda x, p: math.atan(x - p)
+        derivada = lambda x, p: 1 / (1 + (x - p) ** 2)
+
+        curva, _, reducoes_passo = continuacao_natural(func, derivada, [0.0, 10.0], 0.0, erro=1e-10)
+        self.assertTrue(curva[1]['convergiu'])
+        self.assertAlmostEqual(curva[1]['raiz'], 10.0)
+        self.assertGreater(reducoes_passo, 0)
+        self.assertGreater(curva[1]['subpassos'], 1)
+
+    def test_ponto_sem_raiz_nao_converge(self):
+        func = lambda x, p: x**2 - p
+        derivada = lambda x, p: 2 * x
+
+        curva, _, _ = continuacao_natural(func, derivada, [4.0, 1.0, -1.0, 2.0], 1.0, erro=1e-10)
+        self.assertEqual([ponto['convergiu'] for ponto in curva], [True, True, False, True])
+        self.assertIsNone(curva[2]['raiz'])
+        self.assertAlmostEqual(curva[3]['raiz'] ** 2, 2.0)
+
+
+class NewtonIterativoTests(TestCase):
+
+    def test_muitas_iteracoes_sem_limite_de_recursao(self):
+        # x² + 1 não tem raiz real: roda até o máximo de iterações
+        _, iteracoes, _, atingiu_max_iter, _ = newton_raphson(lambda x: x**2 + 1, lambda x: 2 * x, 0.5, 1e-12, 5000)
+        self.assertEqual(iteracoes, 5000)
+        self.assertTrue(atingiu_max_iter)
+
+
+def _eventos(resposta):
+    """Lê uma resposta SSE inteira e devolve [(evento, dados), ...] (comentários ignorados)."""
+    eventos = []
+    for bloco in b''.join(resposta.streaming_content).decode('utf-8').split('\n\n'):
+        campos = dict(linha.split(': ', 1) for linha in bloco.splitlines() if not linha.startswith(':'))
+        if 'event' in campos:
+            eventos.append((campos['event'], json.loads(campos['data'])))
+    return eventos
+
+
+class StreamSSETests(TestCase):
+
+    def test_newton_publica_progresso_e_resultado(self):
+        resposta = self.client.get('/newton/stream/', {
+            'funcao_str': 'x**2 - 4', 'x0_str': '1', 'erro_str': '1e-10', 'max_iter_str': '100',
+        })
+        self.assertEqual(resposta['Content-Type'], 'text/event-stream')
+        eventos = _eventos(resposta)
+
+        self.assertEqual(eventos[0][0], 'progresso')
+        self.assertEqual(eventos[0][1]['iteracao'], 1)
+        nome, resultado = eventos[-1]
+        self.assertEqual(nome, 'resultado')
+        self.assertAlmostEqual(resultado['raiz'], 2.0)
+        self.assertEqual(resultado['iteracoes_registradas'], resultado['iteracoes'])
+        self.assertEqual(resultado['traco']['iteracao'][-1], resultado['iteracoes'])
+
+    def test_bissecao_com_intervalo_invalido_publica_erro(self):
+        eventos = _eventos(self.client.get('/bissecao/stream/', {
+            'funcao_str': 'x**3 - x - 2', 'a_str': '2', 'b_str': '1',
+        }))
+        self.assertEqual(eventos, [('erro', {'mensagem': "O valor de 'a' deve ser menor que o valor de 'b'."})])
+
+    def test_gauss_publica_colunas_eliminadas(self):
+        eventos = _eventos(self.client.get('/gauss/stream/', {
+            'matriz': '2 1 -1; -3 -1 2; -2 1 2', 'vetor': '8,-11,-3',
+        }))
+        nome, resultado = eventos[-1]
+        self.assertEqual(nome, 'resultado')
+        np.testing.assert_allclose(resultado['solucao'], [2, 3, -1])
+        self.assertEqual(resultado['traco']['iteracao'][-1], 3)
+
+    def test_max_iter_acima_do_limite_publica_erro(self):
+        eventos = _eventos(self.client.get('/newton/stream/', {
+            'funcao_str': 'x**2 + 1', 'x0_str': '0.5', 'max_iter_str': str(MAX_ITERACOES_STREAM + 1),
+        }))
+        self.assertEqual([nome for nome, _ in eventos], ['erro'])
+
+    def test_fechar_o_gerador_interrompe_o_solver(self):
+        terminou = threading.Event()
+        excecoes = []
+
+        def executar(callback):
+            try:
+                return newton_raphson(lambda x: x**2 + 1, lambda x: 2 * x, 0.5, 1e-12, 10**9, callback=callback)
+            except Exception as e:
+                excecoes.append(e)
+                raise
+            finally:
+                terminou.set()
+
+        gerador = eventos_sse(executar, intervalo=0.0)
+        self.assertEqual(next(gerador), ": inicio\n\n")
+        self.assertTrue(next(gerador).startswith("event: progresso"))
+        gerador.close()     # O que o servidor faz quando o cliente desconecta
+
+        self.assertTrue(terminou.wait(timeout=5))
+        self.assertIsInstance(excecoes[0], ExecucaoInterrompida)
+
+
+class TracoIteracoesTests(TestCase):
+
+    def test_memoria_constante_com_muitas_iteracoes(self):
+        traco = TracoIteracoes(capacidade=100)
+        for i in range(1, 100001):
+            traco.registrar(i, 1.0 / i, None)
+
+        self.assertEqual(len(traco), 100000)
+        self.assertLessEqual(len(traco.iteracoes), 100)
+        amostra = traco.amostra(50)
+        self.assertLessEqual(len(amostra['iteracao']), 50)
+        self.assertEqual(amostra['iteracao'][0], 1)
+        self.assertEqual(amostra['iteracao'][-1], 100000)     # O último ponto sempre aparece
+        self.assertEqual(amostra['iteracao'], sorted(amostra['iteracao']))
+        self.assertIsNone(amostra['erro_calculado'][-1])
+
+
+class LoteTests(TestCase):
+
+    def test_linhas_malformadas_viram_registros_de_erro(self):
+        linhas = [
+            (1, '{"metodo": "newton", "funcao": "x**2 - 4", "x0": 1}'),
+            (2, '{"metodo": ["gauss"]}'),
+            (3, '{"metodo": "newton_sistemas", "funcoes": 5}'),
+            (4, 'não é json'),
+            (5, '{"metodo": "gauss", "matriz": [[2, 1], [1, 3]], "vetor": [3, 5]}'),
+        ]
+        saida, erros = resolver_pedaco(linhas)
+        registros = [json.loads(linha) for linha in saida]
+
+        self.assertEqual([r['linha'] for r in registros], [1, 2, 3, 4, 5])
+        self.assertEqual([r['status'] for r in registros], ['ok', 'erro', 'erro', 'erro', 'ok'])
+        self.assertEqual(erros, 3)
+        self.assertAlmostEqual(registros[0]['raiz'], 2.0)
+        np.testing.assert_allclose(registros[4]['solucao'], [0.8, 1.4])
+
+
+class BufferHistoricoTests(TestCase):
+
+    def _buffer(self, **kwargs):
+        # Intervalo longo e lote grande: a thread de gravação não dispara durante o teste
+        opcoes = {'tamanho_lote': 1000, 'intervalo': 3600}
+        opcoes.update(kwargs)
+        return BufferHistorico(**opcoes)
+
+    def test_descarregar_grava_o_lote(self):
+        buffer = self._buffer()
+        for i in range(3):
+            buffer.registrar('newton', f'x**2 - {i}', {'x0': float('nan')}, {'raiz': np.float64('inf')}, 1.0)
+
+        self.assertEqual(buffer.descarregar(), 3)
+        self.assertEqual(len(buffer._pendentes), 0)
+        self.assertEqual(RegistroResolucao.objects.count(), 3)
+        registro = RegistroResolucao.objects.first()
+        self.assertEqual((registro.parametros, registro.resultado), ({'x0': None}, {'raiz': None}))
+
+    def test_banco_travado_mantem_o_lote_na_fila(self):
+        buffer = self._buffer()
+        for i in range(3):
+            buffer.registrar('newton', f'x**2 - {i}', {}, {}, 1.0)
+
+        travado = OperationalError('database is locked')
+        with mock.patch.object(RegistroResolucao.objects, 'bulk_create', side_effect=travado), \
+                self.assertLogs('calculo.historico', level='WARNING'):
+            self.assertEqual(buffer.descarregar(), 0)
+        self.assertEqual([r.entrada for r in buffer._pendentes], ['x**2 - 0', 'x**2 - 1', 'x**2 - 2'])
+        self.assertEqual(RegistroResolucao.objects.count(), 0)
+
+        self.assertEqual(buffer.descarregar(), 3)       # Destravou: grava no ciclo seguinte
+        self.assertEqual(RegistroResolucao.objects.count(), 3)
+
+    def test_outro_erro_grava_registro_a_registro(self):
+        buffer = self._buffer()
+        for i in range(3):
+            buffer.registrar('newton', f'x**2 - {i}', {}, {}, 1.0)
+
+        with mock.patch.object(RegistroResolucao.objects, 'bulk_create', side_effect=IntegrityError('falha')), \
+                self.assertLogs('calculo.historico', level='ERROR'):
+            self.assertEqual(buffer.descarregar(), 3)
+        self.assertEqual(RegistroResolucao.objects.count(), 3)
+        self.assertEqual(buffer.descartados, 0)
+
+    def test_descarta_os_mais_antigos_acima_de_max_pendentes(self):
+        buffer = self._buffer(max_pendentes=5)
+        for i in range(8):
+            buffer.registrar('newton', f'x - {i}', {}, {}, 1.0)
+
+        self.assertEqual(buffer.descartados, 3)
+        self.assertEqual([r.entrada for r in buffer._pendentes], [f'x - {i}' for i in range(3, 8)])
+
+
+class RespostasHTTPTests(TestCase):
+
+    def test_paginas_renderizam_sem_collectstatic(self):
+        # O runner de testes força DEBUG=False: o storage não pode exigir o manifesto
+        for url in ('/', '/newton/', '/bissecao/', '/gauss/', '/newton-sistemas/', '/newton/varredura/'):
+            with self.subTest(url=url):
+                self.assertEqual(self.client.get(url).status_code, 200)
+
+    def test_gzip_comprime_html(self):
+        resposta = self.client.get('/newton/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(resposta['Content-Encoding'], 'gzip')
+        self.assertIn(b'Calculadora Newton-Raphson', gzip.decompress(resposta.content))
+
+    def test_gzip_nao_toca_em_server_sent_events(self):
+        resposta = self.client.get('/newton/stream/', {'funcao_str': 'x**2 - 4', 'x0_str': '1'},
+                                   HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(resposta['Content-Type'], 'text/event-stream')
+        self.assertFalse(resposta.has_header('Content-Encoding'))
+        self.assertTrue(b''.join(resposta.streaming_content).startswith(b': inicio'))
+
+    def test_get_repetido_com_if_none_match_devolve_304(self):
+        primeira = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip')
+        self.assertEqual(primeira.status_code, 200)
+        etag = primeira['ETag']
+
+        segunda = self.client.get('/', HTTP_ACCEPT_ENCODING='gzip', HTTP_IF_NONE_MATCH=etag)
+        self.assertEqual(segunda.status_code, 304)
+        self.assertEqual(segunda.content, b'')
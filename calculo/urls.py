@@ -1,11 +1,17 @@
 # calculo/urls.py
 from django.urls import path
-from .views import gauss_calculator_view, home_calculo_view, newton_calculator_view, bissecao_calculator_view
+from .views import gauss_calculator_view, home_calculo_view, newton_calculator_view, bissecao_calculator_view, newton_sistemas_calculator_view, newton_varredura_view
+from .views import newton_stream_view, bissecao_stream_view, gauss_stream_view
 
 urlpatterns = [
     path('', home_calculo_view, name='home_calculo'),
     path('newton/', newton_calculator_view, name='newton_calculator'),
+    path('newton/stream/', newton_stream_view, name='newton_stream'),
+    path('newton/varredura/', newton_varredura_view, name='newton_varredura'),
+    path('newton-sistemas/', newton_sistemas_calculator_view, name='newton_sistemas_calculator'),
     path('bissecao/', bissecao_calculator_view, name='bissecao_calculator'),
+    path('bissecao/stream/', bissecao_stream_view, name='bissecao_stream'),
     path('gauss/', gauss_calculator_view, name='gauss_calculator'),
+    path('gauss/stream/', gauss_stream_view, name='gauss_stream'),
 
 ]
\ No newline at end of file
@@ -1,11 +1,19 @@
+from django.http import StreamingHttpResponse
 from django.shortcuts import render
 import sympy
 from sympy.core.expr import Expr
 from .bissecao_method import metodo_bissecao
 from .newton_method import newton_raphson
+from .newton_sistemas_method import newton_sistemas
+from .continuacao_method import continuacao_natural
+from .progresso import eventos_sse, valor_json
+from .expressoes import escopo_sympy
+from .historico import registrar_resolucao
 from .gauss_method import gauss_somente_web, resolver_por_svd_web, resolver_por_minimos_quadrados_web
 import numpy as np 
 import re 
+import time
+import json
 
 
 
@@ -17,6 +25,7 @@ def home_calculo_view(request):
     return render(request, 'calculo/home_calculo.html')
 
 
+# --- Histórico: converte o resultado para JSON (numpy -> float, NaN -> null) ---
 # --- View da Calculadora de Newton ---
 def newton_calculator_view(request):
     context = {
@@ -79,18 +88,7 @@ def newton_calculator_view(request):
             x_sym = sympy.symbols('x')
             
             # --- CUIDADOS COM SEGURANÇA NO INPUT DO USUÁRIO ---
-            allowed_functions = {
-                "sin": sympy.sin, "cos": sympy.cos, "tan": sympy.tan,
-                "exp": sympy.exp, "ln": sympy.log, "log": sympy.log,
-                "log10": lambda arg: sympy.log(arg, 10),
-                "sqrt": sympy.sqrt, "abs": sympy.Abs, "fabs": sympy.Abs,
-                "pi": sympy.pi, "e": sympy.E,
-                "asin": sympy.asin, "acos": sympy.acos, "atan": sympy.atan,
-                "sinh": sympy.sinh, "cosh": sympy.cosh, "tanh": sympy.tanh,
-            }
-            
-            local_scope = allowed_functions.copy()      # Cria o "escopo local" seguro para o 'sympify'
-            local_scope['x'] = x_sym
+            local_scope = escopo_sympy([x_sym])      # Cria o "escopo local" seguro para o 'sympify' (calculo/expressoes.py)
 
             if not funcao_str:
                 raise ValueError("A expressão da função não pode estar vazia.")
@@ -99,6 +97,7 @@ def newton_calculator_view(request):
             print(f"DEBUG DJANGO VIEW: Antes do sympify, funcao_str: '{funcao_str}'")
             # --- DEBUGGING ---
 
+            inicio_compilacao = time.perf_counter()
             func_sympy = sympy.sympify(funcao_str, locals=local_scope)
 
             # --- DEBUGGING ---
@@ -145,6 +144,7 @@ def newton_calculator_view(request):
             # --- DEBUGGING ---
             
             # --- CÁLCULO DO MÉTODO DE NEWTON-RAPHSON ---
+            inicio_calculo = time.perf_counter()
             raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado = newton_raphson(
                 func_callable,
                 derivada_callable,
@@ -152,6 +152,7 @@ def newton_calculator_view(request):
                 erro,
                 max_iter
             )
+            fim_calculo = time.perf_counter()
 
             # --- DEBUGGING ---
             print(f"DEBUG DJANGO VIEW: Após newton_raphson: raiz={raiz}, iter={iteracoes}")
@@ -174,6 +175,13 @@ def newton_calculator_view(request):
             }
             context['derivada_calculada_str'] = derivada_calculada_str
 
+            registrar_resolucao(        # Histórico gravado em segundo plano (calculo/historico.py)
+                'newton', str(func_sympy),
+                {'x0': x0, 'erro': erro, 'max_iter': max_iter},
+                context['resultado'],
+                tempo_calculo_ms=(fim_calculo - inicio_calculo) * 1000,
+                tempo_compilacao_ms=(inicio_calculo - inicio_compilacao) * 1000,
+            )
 
         # --- CAPTURA DE ERROS ---
         except (sympy.SympifyError, TypeError, NameError) as e:     # Captura erros do SymPy
@@ -206,6 +214,140 @@ def newton_calculator_view(request):
     return render(request, 'calculo/newton_calculator.html', context)
 
 
+# --- Funções Auxiliares (Parser) da Varredura de Parâmetro ---
+MAX_PONTOS_VARREDURA = 5000
+
+def _parse_valores_p(valores_str: str) -> list:
+    """
+    Analisa o formato: 'inicio:fim:pontos' (ex.: '0:10:101') OU uma lista '0, 0.5, 1'
+    """
+    valores_limpos = valores_str.strip().strip('[]')
+    if ':' in valores_limpos:
+        partes = [parte.strip() for parte in valores_limpos.split(':')]
+        if len(partes) != 3:
+            raise ValueError("Use o formato 'inicio:fim:pontos' (ex.: 0:10:101).")
+        inicio = float(partes[0].replace(',', '.'))
+        fim = float(partes[1].replace(',', '.'))
+        pontos = int(partes[2])
+        if pontos < 1:
+            raise ValueError("O número de pontos da varredura deve ser positivo.")
+        if pontos > MAX_PONTOS_VARREDURA:
+            raise ValueError(f"A varredura aceita no máximo {MAX_PONTOS_VARREDURA} pontos.")
+        return [float(v) for v in np.linspace(inicio, fim, pontos)]
+
+    valores = _parse_gauss_vetor(valores_limpos)
+    if len(valores) > MAX_PONTOS_VARREDURA:
+        raise ValueError(f"A varredura aceita no máximo {MAX_PONTOS_VARREDURA} pontos.")
+    return valores
+
+
+# --- View da Varredura de Parâmetro (Newton com Continuação) ---
+def newton_varredura_view(request):
+    context = {
+        'form_data': {      # Valores padrão para o formulário na primeira carga
+            'funcao_str': 'x**3 - p*x - 2',
+            'p_valores_str': '0:10:11',
+            'x0_str': '1.0',
+            'erro_str': '1e-7',
+            'max_iter_str': '50',
+        }
+    }
+
+    if request.method == 'POST':
+        funcao_str = request.POST.get('funcao_str', '').strip().lower()
+        p_valores_str = request.POST.get('p_valores_str', '').strip()
+        x0_str = request.POST.get('x0_str', '').strip()
+        erro_str = request.POST.get('erro_str', '').strip()
+        max_iter_str = request.POST.get('max_iter_str', '50').strip()
+
+        context['form_data'] = {        # Atualiza com os dados enviados
+            'funcao_str': funcao_str,
+            'p_valores_str': p_valores_str,
+            'x0_str': x0_str,
+            'erro_str': erro_str,
+            'max_iter_str': max_iter_str,
+        }
+
+        # --- VALIDAÇÃO E CONVERSÃO DOS INPUTS NUMÉRICOS ---
+        try:
+            if not p_valores_str or not x0_str or not erro_str or not max_iter_str:
+                raise ValueError("Todos os campos numéricos (valores de p, x0, tolerância, máx. iterações) são obrigatórios.")
+
+            valores_p = _parse_valores_p(p_valores_str)
+            x0 = float(x0_str.replace(',', '.'))
+            erro = float(erro_str.replace(',', '.'))
+            max_iter = int(max_iter_str)
+
+            if not valores_p:
+                raise ValueError("Informe pelo menos um valor de p.")
+            if erro <= 0:
+                raise ValueError("A tolerância deve ser um valor positivo.")
+            if max_iter <= 0:
+                raise ValueError("O número máximo de iterações deve ser positivo.")
+
+        except ValueError as e:
+            context['erro_input'] = f"Erro nos valores numéricos: {e}"
+            return render(request, 'calculo/newton_varredura.html', context)
+
+        try:
+            x_sym, p_sym = sympy.symbols('x p')
+            local_scope = escopo_sympy([x_sym, p_sym])
+
+            if not funcao_str:
+                raise ValueError("A expressão da função não pode estar vazia.")
+
+            func_sympy = sympy.sympify(funcao_str, locals=local_scope)
+
+            if not isinstance(func_sympy, Expr):
+                raise ValueError(f"A função '{funcao_str}' não foi interpretada como uma expressão matemática escalar válida.")
+
+            if x_sym not in func_sympy.free_symbols:
+                raise ValueError("A função precisa depender de 'x' para que haja raízes a procurar.")
+
+            extras = func_sympy.free_symbols - {x_sym, p_sym}
+            if extras:
+                nomes = ', '.join(sorted(str(sym) for sym in extras))
+                raise ValueError(f"A função usa variáveis desconhecidas ({nomes}). Use apenas 'x' e o parâmetro 'p'.")
+
+            # --- COMPILAÇÃO ÚNICA DA FUNÇÃO E DA DERIVADA EM (x, p) ---
+            derivada_sympy = sympy.diff(func_sympy, x_sym)
+            func_callable = sympy.lambdify((x_sym, p_sym), func_sympy, modules=['math'])
+            derivada_callable = sympy.lambdify((x_sym, p_sym), derivada_sympy, modules=['math'])
+
+            # --- VARREDURA COM CONTINUAÇÃO NATURAL ---
+            curva, total_iteracoes, reducoes_passo = continuacao_natural(
+                func_callable,
+                derivada_callable,
+                valores_p,
+                x0,
+                erro,
+                max_iter
+            )
+
+            convergidos = sum(1 for ponto in curva if ponto['convergiu'])
+            context['resultado'] = {
+                'curva': curva,
+                'pontos': len(curva),
+                'convergidos': convergidos,
+                'total_iteracoes': total_iteracoes,
+                'media_iteracoes': total_iteracoes / len(curva),
+                'reducoes_passo': reducoes_passo,
+            }
+            context['derivada_calculada_str'] = str(derivada_sympy)
+
+        # --- CAPTURA DE ERROS ---
+        except (sympy.SympifyError, TypeError, NameError) as e:     # Captura erros do SymPy
+            context['erro_sympy'] = f"Erro ao processar a função: '{e}'. Verifique a sintaxe. Use 'x' como variável e 'p' como parâmetro."
+
+        except ValueError as e:     # Captura erros de validação
+            context['erro_sympy'] = str(e)
+
+        except Exception as e:      # Captura qualquer outro erro inesperado
+            context['erro_sympy'] = f"Ocorreu um erro inesperado: {e}"
+
+    return render(request, 'calculo/newton_varredura.html', context)
+
+
 # --- View da Calculadora de Bissecção ---
 def bissecao_calculator_view(request):
     context = {
@@ -259,22 +401,12 @@ def bissecao_calculator_view(request):
 
         try:
             x_sym = sympy.symbols('x')
-            allowed_functions = {       # Copiado da view de Newton-Raphson, ajuste se necessário
-                "sin": sympy.sin, "cos": sympy.cos, "tan": sympy.tan,
-                "exp": sympy.exp, "ln": sympy.log, "log": sympy.log,
-                "log10": lambda arg: sympy.log(arg, 10),
-                "sqrt": sympy.sqrt, "abs": sympy.Abs, "fabs": sympy.Abs,
-                "pi": sympy.pi, "e": sympy.E,
-                "asin": sympy.asin, "acos": sympy.acos, "atan": sympy.atan,
-                "sinh": sympy.sinh, "cosh": sympy.cosh, "tanh": sympy.tanh,
-            }
-
-            local_scope = allowed_functions.copy()
-            local_scope['x'] = x_sym
+            local_scope = escopo_sympy([x_sym])
 
             if not funcao_str:
                 raise ValueError("A expressão da função não pode estar vazia.")
 
+            inicio_compilacao = time.perf_counter()
             func_sympy = sympy.sympify(funcao_str, locals=local_scope)
             
             if not isinstance(func_sympy, Expr):
@@ -286,6 +418,7 @@ def bissecao_calculator_view(request):
             func_callable = sympy.lambdify(x_sym, func_sympy, modules=['math'])
 
             # --- CÁLCULO DO MÉTODO DA BISSEÇÃO ---
+            inicio_calculo = time.perf_counter()
             raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado = metodo_bissecao(
                 func_callable,
                 val_a,
@@ -293,6 +426,7 @@ def bissecao_calculator_view(request):
                 erro,
                 max_iter
             )
+            fim_calculo = time.perf_counter()
             
             # --- MONTA A MENSAGEM BASEADA NO CRITÉRIO DE PARADA ---
             if raiz is None:
@@ -310,6 +444,14 @@ def bissecao_calculator_view(request):
                 'mensagem': mensagem,
             }
 
+            registrar_resolucao(        # Histórico gravado em segundo plano (calculo/historico.py)
+                'bissecao', str(func_sympy),
+                {'a': val_a, 'b': val_b, 'erro': erro, 'max_iter': max_iter},
+                context['resultado'],
+                tempo_calculo_ms=(fim_calculo - inicio_calculo) * 1000,
+                tempo_compilacao_ms=(inicio_calculo - inicio_compilacao) * 1000,
+            )
+
         # --- CAPTURA DE ERROS ---
         except (sympy.SympifyError, TypeError, NameError) as e:     # Captura erros do SymPy
             context['erro_sympy'] = f"Erro ao processar a função: '{e}'. Verifique a sintaxe."
@@ -326,6 +468,136 @@ def bissecao_calculator_view(request):
     return render(request, 'calculo/bissecao_calculator.html', context)
 
 
+# --- View da Calculadora de Newton para Sistemas Não Lineares ---
+def newton_sistemas_calculator_view(request):
+    context = {
+        'form_data': {      # Valores padrão para o formulário na primeira carga
+            'funcoes_str': 'x1**2 + x2**2 - 4; x1*x2 - 1',
+            'x0_str': '2, 0.5',
+            'erro_str': '1e-7',
+            'max_iter_str': '100',
+            'reuso_str': '1',
+        }
+    }
+
+    if request.method == 'POST':
+        funcoes_str = request.POST.get('funcoes_str', '').strip().lower()
+        x0_str = request.POST.get('x0_str', '').strip()
+        erro_str = request.POST.get('erro_str', '').strip()
+        max_iter_str = request.POST.get('max_iter_str', '100').strip()
+        reuso_str = request.POST.get('reuso_str', '1').strip()
+
+        context['form_data'] = {        # Atualiza com os dados enviados
+            'funcoes_str': funcoes_str,
+            'x0_str': x0_str,
+            'erro_str': erro_str,
+            'max_iter_str': max_iter_str,
+            'reuso_str': reuso_str,
+        }
+
+        # --- VALIDAÇÃO E CONVERSÃO DOS INPUTS NUMÉRICOS ---
+        try:
+            if not x0_str or not erro_str or not max_iter_str or not reuso_str:
+                raise ValueError("Todos os campos numéricos (x0, tolerância, máx. iterações, reuso da jacobiana) são obrigatórios.")
+
+            x0 = _parse_gauss_vetor(x0_str)
+            erro = float(erro_str.replace(',', '.'))
+            max_iter = int(max_iter_str)
+            reuso = int(reuso_str)
+
+            if erro <= 0:
+                raise ValueError("A tolerância deve ser um valor positivo.")
+            if max_iter <= 0:
+                raise ValueError("O número máximo de iterações deve ser positivo.")
+            if reuso <= 0:
+                raise ValueError("O reuso da jacobiana deve ser um inteiro positivo (1 = Newton clássico).")
+
+        except ValueError as e:
+            context['erro_input'] = f"Erro nos valores numéricos: {e}"
+            return render(request, 'calculo/newton_sistemas_calculator.html', context)
+
+        try:
+            funcoes_lista = [f.strip() for f in funcoes_str.split(';') if f.strip()]     # Uma equação por ';'
+            if not funcoes_lista:
+                raise ValueError("O sistema de equações não pode estar vazio.")
+
+            n = len(funcoes_lista)
+            if len(x0) != n:
+                raise ValueError(f"O sistema tem {n} equações, mas a estimativa inicial tem {len(x0)} valores.")
+
+            x_syms = sympy.symbols(f'x1:{n + 1}')       # x1, x2, ..., xn
+            local_scope = escopo_sympy(x_syms)
+
+            inicio_compilacao = time.perf_counter()
+            funcs_sympy = []
+            for i, f_str in enumerate(funcoes_lista):
+                f_sympy = sympy.sympify(f_str, locals=local_scope)
+                if not isinstance(f_sympy, Expr):
+                    raise ValueError(f"A equação {i+1} ('{f_str}') não foi interpretada como uma expressão matemática escalar válida.")
+                extras = f_sympy.free_symbols - set(x_syms)
+                if extras:
+                    nomes = ', '.join(sorted(str(s) for s in extras))
+                    raise ValueError(f"A equação {i+1} usa variáveis desconhecidas ({nomes}). Use apenas x1 a x{n}.")
+                funcs_sympy.append(f_sympy)
+
+            # --- JACOBIANA SIMBÓLICA (montada uma única vez) ---
+            F_sympy = sympy.Matrix(funcs_sympy)
+            J_sympy = F_sympy.jacobian(x_syms)
+
+            func_callable = sympy.lambdify(x_syms, F_sympy, modules=['numpy'])
+            jacobiana_callable = sympy.lambdify(x_syms, J_sympy, modules=['numpy'])
+
+            # --- CÁLCULO DO MÉTODO DE NEWTON MULTIVARIADO ---
+            inicio_calculo = time.perf_counter()
+            raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado, fatoracoes = newton_sistemas(
+                func_callable,
+                jacobiana_callable,
+                x0,
+                erro,
+                max_iter,
+                reuso
+            )
+            fim_calculo = time.perf_counter()
+
+            # --- MONTA A MENSAGEM BASEADA NO CRITÉRIO DE PARADA ---
+            if raiz is None:
+                mensagem = "Falha: Jacobiana singular ou F(x) não finita (ex.: fora do domínio da função)."
+            elif atingiu_max_iter:
+                mensagem = "Máximo de iterações atingido."
+            else:
+                mensagem = "Convergiu pelo erro relativo."
+
+            context['resultado'] = {
+                'raiz': list(raiz) if raiz is not None else None,
+                'iteracoes': iteracoes,
+                'fatoracoes': fatoracoes,
+                'f_na_raiz': list(f_na_raiz) if f_na_raiz is not None else None,
+                'erro_calculado': erro_calculado,
+                'mensagem': mensagem,
+            }
+            context['jacobiana_str'] = str(J_sympy.tolist())
+
+            registrar_resolucao(        # Histórico gravado em segundo plano (calculo/historico.py)
+                'newton_sistemas', '; '.join(str(f) for f in funcs_sympy),
+                {'x0': x0, 'erro': erro, 'max_iter': max_iter, 'reuso_jacobiano': reuso},
+                context['resultado'],
+                tempo_calculo_ms=(fim_calculo - inicio_calculo) * 1000,
+                tempo_compilacao_ms=(inicio_calculo - inicio_compilacao) * 1000,
+            )
+
+        # --- CAPTURA DE ERROS ---
+        except (sympy.SympifyError, TypeError, NameError) as e:     # Captura erros do SymPy
+            context['erro_sympy'] = f"Erro ao processar o sistema: '{e}'. Verifique a sintaxe. Use x1, x2, ..., xn como variáveis."
+
+        except ValueError as e:     # Captura erros de validação
+            context['erro_sympy'] = str(e)
+
+        except Exception as e:      # Captura qualquer outro erro inesperado
+            context['erro_sympy'] = f"Ocorreu um erro inesperado: {e}"
+
+    return render(request, 'calculo/newton_sistemas_calculator.html', context)
+
+
 # --- Funções Auxiliares (Parser) de Gauss ---
 def _parse_gauss_matriz(matriz_str: str) -> list:
     """ 
@@ -372,6 +644,7 @@ def gauss_calculator_view(request):
             'tamanho_matriz': '3x3',
             'matriz': '2 1 -1; -3 -1 2; -2 1 2',        # Formato da print
             'vetor': '8, -11, -3',      # Formato da print
+            'precisao_mista': False,
         }
     }
 
@@ -380,11 +653,13 @@ def gauss_calculator_view(request):
         tamanho_matriz_str = request.POST.get('tamanho_matriz', '').strip()
         matriz_str = request.POST.get('matriz', '').strip()
         termos_str = request.POST.get('vetor', '').strip()
+        precisao_mista = request.POST.get('precisao_mista') == 'on'
         
         context['form_data'] = {
             'tamanho_matriz': tamanho_matriz_str,
             'matriz': matriz_str,
             'vetor': termos_str,
+            'precisao_mista': precisao_mista,
         }
         
         metodo_alternativo = request.POST.get('metodo_alternativo') 
@@ -409,12 +684,14 @@ def gauss_calculator_view(request):
 
             # --- CHAMA A FUNÇÃO DE CÁLCULO ---
             resultado_dict = {}
+            inicio_calculo = time.perf_counter()
             if metodo_alternativo == 'svd':
                 resultado_dict = resolver_por_svd_web(A, b)
             elif metodo_alternativo == 'mq':
                  resultado_dict = resolver_por_minimos_quadrados_web(A, b)
             else:
-                resultado_dict = gauss_somente_web(A, b)        # Tenta Gauss como padrão
+                resultado_dict = gauss_somente_web(A, b, precisao_mista=precisao_mista)        # Tenta Gauss como padrão
+            fim_calculo = time.perf_counter()
 
             context['solucao'] = resultado_dict.get('solucao')
             context['mensagem'] = resultado_dict.get('mensagem')
@@ -425,9 +702,163 @@ def gauss_calculator_view(request):
             elif resultado_dict.get('status') == 'nao_quadrado':
                 context['sugerir_mq'] = True
 
+            registrar_resolucao(        # Histórico gravado em segundo plano (calculo/historico.py)
+                metodo_alternativo or 'gauss', json.dumps({'A': A, 'b': b}),
+                {'precisao_mista': precisao_mista},
+                resultado_dict,
+                tempo_calculo_ms=(fim_calculo - inicio_calculo) * 1000,
+            )
+
         except ValueError as e:     # Erro de formato
             context['erro_input'] = str(e)
         except Exception as e:
             context['erro_input'] = f"Ocorreu um erro inesperado: {e}"
 
-    return render(request, 'calculo/gauss_calculator.html', context)
\ No newline at end of file
+    return render(request, 'calculo/gauss_calculator.html', context)
+
+
+# --- Streaming de Progresso (Server-Sent Events) ---
+def _compilar_funcao_x(funcao_str: str):
+    """
+    Interpreta f(x) com o mesmo escopo seguro das calculadoras e devolve
+    (func_callable, derivada_callable) compilados com lambdify.
+    """
+    x_sym = sympy.symbols('x')
+    local_scope = escopo_sympy([x_sym])
+
+    if not funcao_str:
+        raise ValueError("A expressão da função não pode estar vazia.")
+
+    func_sympy = sympy.sympify(funcao_str, locals=local_scope)
+
+    if not isinstance(func_sympy, Expr):
+        raise ValueError(f"A função '{funcao_str}' não foi interpretada como uma expressão matemática escalar válida.")
+
+    if func_sympy.is_number:
+        raise ValueError(f"A função fornecida é uma constante '{func_sympy}'. Não há raízes a procurar.")
+
+    func_callable = sympy.lambdify(x_sym, func_sympy, modules=['math'])
+    derivada_callable = sympy.lambdify(x_sym, sympy.diff(func_sympy, x_sym), modules=['math'])
+    return func_callable, derivada_callable
+
+
+MAX_ITERACOES_STREAM = 100000      # Endpoints GET públicos: limita o tempo de CPU por requisição
+
+
+def _parse_tolerancia_iteracoes(params):
+    erro_str = params.get('erro_str', '1e-7').strip()
+    max_iter_str = params.get('max_iter_str', '100').strip()
+
+    erro = float(erro_str.replace(',', '.'))
+    max_iter = int(max_iter_str)
+
+    if erro <= 0:
+        raise ValueError("A tolerância deve ser um valor positivo.")
+    if max_iter <= 0:
+        raise ValueError("O número máximo de iterações deve ser positivo.")
+    if max_iter > MAX_ITERACOES_STREAM:
+        raise ValueError(f"O número máximo de iterações deve ser no máximo {MAX_ITERACOES_STREAM}.")
+    return erro, max_iter
+
+
+def _resposta_sse(executar):
+    response = StreamingHttpResponse(eventos_sse(executar), content_type='text/event-stream')
+    response['Cache-Control'] = 'no-cache'
+    response['X-Accel-Buffering'] = 'no'        # Desliga o buffer de proxies como o nginx
+    return response
+
+
+def _mensagem_parada(raiz, atingiu_max_iter, mensagem_falha):
+    if raiz is None:
+        return mensagem_falha
+    if atingiu_max_iter:
+        return "Máximo de iterações atingido."
+    return "Convergiu pelo erro relativo."
+
+
+def newton_stream_view(request):
+    """
+    Newton-Raphson com progresso em server-sent events.
+    Parâmetros (GET): funcao_str, x0_str, erro_str, max_iter_str.
+    """
+    params = request.GET
+
+    def executar(callback):
+        funcao_str = params.get('funcao_str', '').strip().lower()
+        x0 = float(params.get('x0_str', '').strip().replace(',', '.'))
+        erro, max_iter = _parse_tolerancia_iteracoes(params)
+        func_callable, derivada_callable = _compilar_funcao_x(funcao_str)
+
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado = newton_raphson(
+            func_callable, derivada_callable, x0, erro, max_iter, callback=callback
+        )
+        return {
+            'raiz': valor_json(raiz),
+            'iteracoes': iteracoes,
+            'f_na_raiz': valor_json(f_na_raiz),
+            'erro_calculado': valor_json(erro_calculado),
+            'mensagem': _mensagem_parada(raiz, atingiu_max_iter, "Falha: Derivada igual a zero."),
+        }
+
+    return _resposta_sse(executar)
+
+
+def bissecao_stream_view(request):
+    """
+    Bisseção com progresso em server-sent events.
+    Parâmetros (GET): funcao_str, a_str, b_str, erro_str, max_iter_str.
+    """
+    params = request.GET
+
+    def executar(callback):
+        funcao_str = params.get('funcao_str', '').strip().lower()
+        val_a = float(params.get('a_str', '').strip().replace(',', '.'))
+        val_b = float(params.get('b_str', '').strip().replace(',', '.'))
+        erro, max_iter = _parse_tolerancia_iteracoes(params)
+        if val_a >= val_b:
+            raise ValueError("O valor de 'a' deve ser menor que o valor de 'b'.")
+        func_callable, _ = _compilar_funcao_x(funcao_str)
+
+        raiz, iteracoes, f_na_raiz, atingiu_max_iter, erro_calculado = metodo_bissecao(
+            func_callable, val_a, val_b, erro, max_iter, callback=callback
+        )
+        return {
+            'raiz': valor_json(raiz),
+            'iteracoes': iteracoes,
+            'f_na_raiz': valor_json(f_na_raiz),
+            'erro_calculado': valor_json(erro_calculado),
+            'mensagem': _mensagem_parada(raiz, atingiu_max_iter, "Erro: f(a) e f(b) devem ter sinais opostos."),
+        }
+
+    return _resposta_sse(executar)
+
+
+def gauss_stream_view(request):
+    """
+    Eliminação de Gauss com progresso (colunas eliminadas) em server-sent events.
+    Parâmetros (GET): matriz, vetor, precisao_mista ('on' para ativar).
+    """
+    params = request.GET
+
+    def executar(callback):
+        A = _parse_gauss_matriz(params.get('matriz', '').strip())
+        b = _parse_gauss_vetor(params.get('vetor', '').strip())
+
+        if not A or not b:
+            raise ValueError("Matriz A ou vetor b estão vazios.")
+        if len(A) != len(b):
+            raise ValueError(f"O número de linhas da matriz ({len(A)}) é diferente do número de termos no vetor b ({len(b)}).")
+
+        resultado_dict = gauss_somente_web(
+            A, b, precisao_mista=params.get('precisao_mista') == 'on', callback=callback
+        )
+        return {
+            'status': resultado_dict.get('status'),
+            'solucao': [valor_json(v) for v in resultado_dict['solucao']] if resultado_dict.get('solucao') else None,
+            'colunas': len(b),
+            'iteracoes_refinamento': resultado_dict.get('iteracoes_refinamento'),
+            'erro_retroativo': valor_json(resultado_dict.get('erro_retroativo')),
+            'mensagem': resultado_dict.get('mensagem'),
+        }
+
+    return _resposta_sse(executar)
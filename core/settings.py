@@ -36,12 +36,16 @@ INSTALLED_APPS = [
     'django.contrib.contenttypes',
     'django.contrib.sessions',
     'django.contrib.messages',
+    'whitenoise.runserver_nostatic',     # runserver também serve os estáticos pelo WhiteNoise
     'django.contrib.staticfiles',
     'calculo'
 ]
 
 MIDDLEWARE = [
     'django.middleware.security.SecurityMiddleware',
+    'whitenoise.middleware.WhiteNoiseMiddleware',       # Estáticos com hash, cache longo e .gz/.br pré-comprimidos
+    'calculo.middleware.GZipMiddleware',        # Comprime HTML/JSON (exceto server-sent events)
+    'django.middleware.http.ConditionalGetMiddleware',      # ETag / If-None-Match -> 304
     'django.contrib.sessions.middleware.SessionMiddleware',
     'django.middleware.common.CommonMiddleware',
     'django.middleware.csrf.CsrfViewMiddleware',
@@ -77,9 +81,20 @@ DATABASES = {
     'default': {
         'ENGINE': 'django.db.backends.sqlite3',
         'NAME': BASE_DIR / 'db.sqlite3',
+        'OPTIONS': {
+            # WAL: leitores não bloqueiam o escritor (e vice-versa) entre vários workers
+            'init_command': 'PRAGMA journal_mode=WAL; PRAGMA synchronous=NORMAL;',
+            'timeout': 20,      # busy timeout (s): espera o lock em vez de falhar com "database is locked"
+            'transaction_mode': 'IMMEDIATE',
+        },
     }
 }
 
+# Histórico de resoluções (calculo/historico.py): gravado em lotes fora da requisição
+HISTORICO_ATIVO = True
+HISTORICO_TAMANHO_LOTE = 100
+HISTORICO_INTERVALO_GRAVACAO = 2.0      # segundos
+
 
 # Password validation
 # https://docs.djangoproject.com/en/5.2/ref/settings/#auth-password-validators
@@ -116,10 +131,22 @@ USE_TZ = True
 # https://docs.djangoproject.com/en/5.2/howto/static-files/
 
 STATIC_URL = '/static/'
+STATIC_ROOT = BASE_DIR / 'staticfiles'
 STATICFILES_DIRS = [
     os.path.join(BASE_DIR, 'calculo/static'),
 ]
 
+# collectstatic gera nomes com hash do conteúdo (cacheáveis "para sempre") e variantes .gz/.br.
+# Sem collectstatic as páginas continuam funcionando, com os nomes originais (calculo/storage.py).
+STORAGES = {
+    'default': {
+        'BACKEND': 'django.core.files.storage.FileSystemStorage',
+    },
+    'staticfiles': {
+        'BACKEND': 'calculo.storage.ManifestStaticFilesNaoEstrito',
+    },
+}
+
 # Default primary key field type
 # https://docs.djangoproject.com/en/5.2/ref/settings/#default-auto-field
 